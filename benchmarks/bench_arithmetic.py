@@ -0,0 +1,64 @@
+r"""Benchmark: counting with CustomNumber, with and without temporaries.
+
+Run with:
+    python benchmarks/bench_arithmetic.py
+
+Every step also renders the number, as when allocating IDs.
+"""
+
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+COUNT: int = 200_000
+
+
+def main() -> None:
+    sysN = cn.CustomNumeralSystem("kje5nCs21Q9vW0KMqc")
+
+    for digits in [1, 20, 200]:
+        start: str = "j" * digits
+
+        def new_one():  # How it had to be written before
+            counter = cn.CustomNumber(sysN, start)
+            for _ in range(COUNT):
+                counter = counter + cn.CustomNumber(sysN, "j")
+                str(counter)
+            return str(counter)
+
+        def shared_one():
+            counter = cn.CustomNumber(sysN, start)
+            one = cn.CustomNumber(sysN, "j")
+            for _ in range(COUNT):
+                counter = counter + one
+                str(counter)
+            return str(counter)
+
+        def in_place_int():
+            counter = cn.CustomNumber(sysN, start)
+            for _ in range(COUNT):
+                counter += 1
+                str(counter)
+            return str(counter)
+
+        def succ():
+            counter = cn.CustomNumber(sysN, start)
+            for _ in range(COUNT):
+                counter.succ()
+                str(counter)
+            return str(counter)
+
+        assert new_one() == shared_one() == in_place_int() == succ()
+        print(f"{digits} digits")
+        for name, function in [
+            ("counter = counter + CustomNumber(...)", new_one),
+            ("counter = counter + one", shared_one),
+            ("counter += 1", in_place_int),
+            ("counter.succ()", succ),
+        ]:
+            seconds: float = min(timeit.repeat(function, number=1, repeat=3))
+            print(f"  {name:<40} {seconds * 1e9 / COUNT:>8.1f} ns/step")
+
+
+if __name__ == "__main__":
+    main()
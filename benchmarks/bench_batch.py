@@ -0,0 +1,53 @@
+r"""Benchmark: batch encode_many()/decode_many() against one CustomNumber each.
+
+Run with:
+    python benchmarks/bench_batch.py
+
+The NumPy rows are skipped if NumPy is not installed.
+"""
+
+import random
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+COUNT: int = 100_000
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def report(name: str, function) -> None:
+    seconds: float = min(timeit.repeat(function, number=1, repeat=3))
+    print(f"{name:<34} {seconds * 1e3:>9.1f} ms {COUNT / seconds / 1e6:>7.2f} M/s")
+
+
+def main() -> None:
+    sysN = cn.CustomNumeralSystem(DIGITS)
+    rng = random.Random(2024)
+    numbers = [rng.randrange(-(2**62), 2**62) for _ in range(COUNT)]
+    values = sysN.encode_many(numbers)
+    zero = cn.CustomNumber(sysN, "0")
+
+    def one_by_one_encode():
+        for number in numbers:
+            zero.from_decimal(number)
+            str(zero)
+
+    report("encode: CustomNumber each", one_by_one_encode)
+    report("encode: encode_many(list)", lambda: sysN.encode_many(numbers))
+    report("decode: CustomNumber each", lambda: [cn.CustomNumber(sysN, x) for x in values])
+    report("decode: decode_many(list)", lambda: sysN.decode_many(values))
+
+    if np is not None:
+        array = np.array(numbers, dtype=np.int64)
+        strings = np.array(values)
+        report("encode: encode_many(ndarray)", lambda: sysN.encode_many(array))
+        report("decode: decode_many(ndarray)", lambda: sysN.decode_many(strings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+r"""Benchmark: numbers from bytes, in bytes mode and trough str.
+
+Run with:
+    python benchmarks/bench_bytes.py
+"""
+
+import random
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+COUNT: int = 200_000
+
+
+def main() -> None:
+    for digits in [b"0123456789ABCDEF", b"kje5nCs21Q9vW0KMqc"]:
+        sysS = cn.CustomNumeralSystem(digits.decode())
+        sysB = cn.CustomNumeralSystem(digits)
+        values = [sysB._from_int_bytes(random.getrandbits(64)) for _ in range(COUNT)]
+        buffer = memoryview(b"".join(values))  # One long valid number
+
+        def bytes_mode():
+            for value in values:
+                cn.CustomNumber(sysB, value).to_decimal()
+
+        def trough_str():
+            for value in values:
+                cn.CustomNumber(sysS, value.decode()).to_decimal()
+
+        def validate_bytes():
+            sysB.valid_number(buffer)
+
+        def validate_str():
+            sysS.valid_number(bytes(buffer).decode())
+
+        print(f"base {sysB.base}")
+        for name, function in [
+            ("CustomNumber, bytes mode", bytes_mode),
+            ("CustomNumber, decoded", trough_str),
+        ]:
+            seconds: float = min(timeit.repeat(function, number=1, repeat=3))
+            print(f"  {name:<28} {seconds * 1e9 / COUNT:>8.1f} ns/number")
+        for name, function in [
+            ("valid_number(), bytes", validate_bytes),
+            ("valid_number(), decoded", validate_str),
+        ]:
+            seconds = min(timeit.repeat(function, number=1, repeat=3))
+            print(f"  {name:<28} {seconds * 1e9 / len(buffer):>8.2f} ns/byte")
+
+
+if __name__ == "__main__":
+    main()
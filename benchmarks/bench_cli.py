@@ -0,0 +1,38 @@
+r"""Benchmark: python -m custom_numbers throughput.
+
+Run with:
+    python benchmarks/bench_cli.py
+"""
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+LINES: int = 1_000_000
+DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "numbers.txt")
+        with open(path, "w") as stream:
+            for _ in range(LINES):
+                stream.write(f"{random.getrandbits(64)}\n")
+
+        for workers in ["1", "2", str(os.cpu_count() or 1)]:
+            command = [sys.executable, "-m", "custom_numbers", "--dst", DIGITS]
+            start: float = time.perf_counter()
+            subprocess.run(
+                command + ["--workers", workers, path],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+            seconds: float = time.perf_counter() - start
+            print(f"--workers {workers:<3} {LINES / seconds:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+r"""Benchmark: digit-by-digit against divide-and-conquer conversion.
+
+Run with:
+    python benchmarks/bench_conversion.py
+
+Compares the digit-by-digit conversions (the simple path) with the
+divide-and-conquer ones used by to_decimal() and from_decimal() for big
+numbers, across sizes.
+"""
+
+import random
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LENGTHS = (100, 1000, 10000, 100000)
+
+
+def best_of(function, repeat: int = 3) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main() -> None:
+    sysN = cn.CustomNumeralSystem(DIGITS)
+    rng = random.Random(2024)
+
+    print(
+        f"{'digits':>8} {'to_int simple':>14} {'to_int d&c':>12}"
+        f" {'from_int simple':>16} {'from_int d&c':>13}   (ms)"
+    )
+    for length in LENGTHS:
+        value = rng.choice(DIGITS[1:]) + "".join(
+            rng.choice(DIGITS) for _ in range(length - 1)
+        )
+        number = sysN._to_int(value)
+        assert sysN._to_int_small(value) == number
+        assert sysN._from_int(number) == value
+
+        timings = (
+            best_of(lambda: sysN._to_int_small(value)),
+            best_of(lambda: sysN._to_int(value)),
+            best_of(lambda: sysN._from_int_small(number)),
+            best_of(lambda: sysN._from_int(number)),
+        )
+        print(f"{length:>8}" + "".join(
+            f" {t * 1e3:>{w}.2f}" for t, w in zip(timings, (14, 12, 16, 13))
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+r"""Benchmark: adding long CustomNumbers digit-wise or trough int.
+
+Run with:
+    python benchmarks/bench_digitwise.py
+
+Both numbers are created from strings, added and the sum is rendered,
+as in str(CustomNumber(sysN, a) + CustomNumber(sysN, b)). The int round
+trip is measured with the digit-wise threshold raised out of reach.
+"""
+
+import random
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+THRESHOLD: int = cn.CustomNumber._DIGITWISE_THRESHOLD
+
+
+def add(sysN: cn.CustomNumeralSystem, a: str, b: str) -> str:
+    return str(cn.CustomNumber(sysN, a) + cn.CustomNumber(sysN, b))
+
+
+def main() -> None:
+    for digits in ["0123456789", "kje5nCs21Q9vW0KMqc"]:
+        sysN = cn.CustomNumeralSystem(digits)
+        print(f"base {sysN.base}")
+        for length in [128, 256, 512, 1024, 4096, 16384, 65536]:
+            low, high = sysN.base ** (length - 1), sysN.base**length
+            a = sysN._from_int(random.randrange(low, high))
+            b = sysN._from_int(random.randrange(low, high))
+
+            times = []
+            for threshold in [0, 10**18]:
+                cn.CustomNumber._DIGITWISE_THRESHOLD = threshold
+                seconds = timeit.repeat(lambda: add(sysN, a, b), number=3, repeat=3)
+                times.append(min(seconds) / 3)
+            cn.CustomNumber._DIGITWISE_THRESHOLD = THRESHOLD
+
+            digitwise, round_trip = times
+            print(
+                f"  {length:>6} digits: digit-wise {digitwise * 1e6:>9.0f} us,"
+                f" int round trip {round_trip * 1e6:>9.0f} us"
+                f" ({round_trip / digitwise:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+r"""Benchmark: CustomNumber.from_decimal() against the output length.
+
+Run with:
+    python benchmarks/bench_from_decimal.py
+
+from_decimal() only stores the integer, the digits are rendered when
+the number is displayed, so each timed call also does str(num).
+The time per output digit should grow only slowly with the length: a
+quadratic conversion would grow it tenfold from 1000 to 10000 digits.
+"""
+
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LENGTHS = (10, 100, 1000, 5000, 10000)
+
+
+def main() -> None:
+    sysN = cn.CustomNumeralSystem(DIGITS)
+    num = cn.CustomNumber(sysN, "0")
+
+    def convert(number: int) -> str:
+        num.from_decimal(number)
+        return str(num)
+
+    print(f"{'digits':>8} {'total ms':>10} {'ns/digit':>10}")
+    for length in LENGTHS:
+        number = sysN.base**length - 1
+        repeat = max(1, 20000 // length)
+        seconds = min(
+            timeit.repeat(lambda: convert(number), number=repeat, repeat=3)
+        )
+        seconds /= repeat
+        print(f"{length:>8} {seconds * 1e3:>10.3f} {seconds * 1e9 / length:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
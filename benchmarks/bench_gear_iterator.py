@@ -0,0 +1,72 @@
+r"""Benchmark: GearIterator stepping.
+
+Run with:
+    python benchmarks/bench_gear_iterator.py
+"""
+
+import os
+import tempfile
+import timeit
+from itertools import islice
+
+from custom_numbers import custom_numbers as cn
+
+DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+COUNT: int = 1_000_000
+
+
+def report(name: str, function) -> None:
+    seconds: float = min(timeit.repeat(function, number=1, repeat=3))
+    print(f"{name:<28} {seconds * 1e9 / COUNT:>8.1f} ns/value")
+
+
+def main() -> None:
+    sysN = cn.CustomNumeralSystem(DIGITS)
+
+    def plain():
+        for _ in islice(cn.GearIterator(sysN, 6, 8), COUNT):
+            pass
+
+    def with_end_value():
+        for _ in islice(cn.GearIterator(sysN, 6, 0, "", "zzzzzzzz"), COUNT):
+            pass
+
+    def batches():
+        it = cn.GearIterator(sysN, 6, 8)
+        for _ in range(COUNT // 10000):
+            it.next_batch(10000)
+
+    def fill():
+        it = cn.GearIterator(sysN, 6, 8)
+        buffer = bytearray(70000)  # 10000 values of 6 digits + "\n"
+        for _ in range(COUNT // 10000):
+            it.fill(buffer)
+
+    def checkpointed():
+        it = cn.GearIterator(sysN, 6, 8)
+        it.checkpoint(os.path.join(directory, "state.json"), every=100000)
+        for _ in islice(it, COUNT):
+            pass
+
+    def stepped(step: int, reverse: bool = False):
+        def run():
+            it = cn.GearIterator(sysN, 6, 30, step=step, reverse=reverse)
+            for _ in islice(it, COUNT):
+                pass
+
+        return run
+
+    report("next(), max_length", plain)
+    with tempfile.TemporaryDirectory() as directory:
+        report("next(), checkpoint/100000", checkpointed)
+    report("next(), end_value", with_end_value)
+    report("next_batch(10000)", batches)
+    report("fill(70000 bytes)", fill)
+    # The cost per value should not depend on the step
+    for exponent in [0, 1, 3, 9, 18]:
+        report(f"next(), step=10**{exponent}", stepped(10**exponent))
+        report(f"next(), step=10**{exponent}, reverse", stepped(10**exponent, True))
+
+
+if __name__ == "__main__":
+    main()
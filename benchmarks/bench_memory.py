@@ -0,0 +1,33 @@
+r"""Benchmark: memory used per CustomNumber instance.
+
+Run with:
+    python benchmarks/bench_memory.py
+
+Measured with tracemalloc. The strings the numbers are created from are
+allocated beforehand, as they usually come from the outside.
+"""
+
+import tracemalloc
+
+from custom_numbers import custom_numbers as cn
+
+COUNT: int = 1_000_000
+
+
+def main() -> None:
+    sysN = cn.CustomNumeralSystem("0123456789abcdef")
+    values = [format(i * 7919 + 10**6, "x") for i in range(COUNT)]
+    nums = [None] * COUNT
+
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    for i, value in enumerate(values):
+        nums[i] = cn.CustomNumber(sysN, value)
+    created: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"CustomNumber: {(created - before) / COUNT:.1f} bytes per instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+r"""Benchmark: MixedRadixNumeralSystem against splicing CustomNumbers.
+
+Run with:
+    python benchmarks/bench_mixed_radix.py
+"""
+
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+LETTERS: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGITS: str = "0123456789"
+COUNT: int = 26 * 26 * 100
+
+
+def main() -> None:
+    plates = cn.MixedRadixNumeralSystem([LETTERS, LETTERS, DIGITS, DIGITS])
+    letters = cn.CustomNumeralSystem(LETTERS)
+    digits = cn.CustomNumeralSystem(DIGITS)
+
+    def mixed():
+        for number in range(COUNT):
+            plates._to_int(plates._from_int(number))
+
+    def spliced():
+        # The old way: one CustomNumber per part, padded and glued together
+        for number in range(COUNT):
+            high, low = divmod(number, 100)
+            head = cn.CustomNumber(letters, "A")
+            head.from_decimal(high)
+            tail = cn.CustomNumber(digits, "0")
+            tail.from_decimal(low)
+            value = str(head).rjust(2, "A") + str(tail).rjust(2, "0")
+            cn.CustomNumber(letters, value[:2]).to_decimal() * 100 + cn.CustomNumber(
+                digits, value[2:]
+            ).to_decimal()
+
+    for name, function in [("mixed radix", mixed), ("spliced", spliced)]:
+        seconds: float = min(timeit.repeat(function, number=1, repeat=3))
+        print(f"{name:<12} {seconds * 1e9 / COUNT:>8.1f} ns/round trip")
+
+
+if __name__ == "__main__":
+    main()
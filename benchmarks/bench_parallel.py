@@ -0,0 +1,46 @@
+r"""Benchmark: GearIterator.map_shards() scaling from 1 to N worker processes.
+
+Run with:
+    python benchmarks/bench_parallel.py [max_workers]
+
+Default max_workers is the number of CPUs.
+"""
+
+import os
+import sys
+import time
+import zlib
+
+from custom_numbers import custom_numbers as cn
+
+DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyz"
+MAX_LENGTH: int = 4  # 36**4 = 1679616 values
+
+
+def work(shard: cn.GearIterator) -> int:
+    r"""Some per-value work: how many values have a CRC32 divisible by 7."""
+
+    found: int = 0
+    while True:
+        values = shard.next_batch(10000)
+        if not values:
+            return found
+        found += sum(1 for value in values if zlib.crc32(value.encode()) % 7 == 0)
+
+
+def main() -> None:
+    max_workers: int = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    it = cn.GearIterator(cn.CustomNumeralSystem(DIGITS), 0, MAX_LENGTH)
+
+    baseline: float = 0.0
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    for workers in range(1, max_workers + 1):
+        started: float = time.perf_counter()
+        found: int = sum(it.map_shards(work, workers=workers, shards=workers * 4))
+        seconds: float = time.perf_counter() - started
+        baseline = baseline or seconds
+        print(f"{workers:>8} {seconds:>9.2f} {baseline / seconds:>8.2f}   ({found})")
+
+
+if __name__ == "__main__":
+    main()
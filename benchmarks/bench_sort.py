@@ -0,0 +1,46 @@
+r"""Benchmark: sorting CustomNumbers, by their comparisons or by sort_key.
+
+Run with:
+    python benchmarks/bench_sort.py
+"""
+
+import random
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+COUNT: int = 200_000
+LONG_COUNT: int = 2_000
+
+
+def main() -> None:
+    sysN = cn.CustomNumeralSystem("kje5nCs21Q9vW0KMqc")
+    short = [
+        cn.CustomNumber._from_decimal(sysN, random.getrandbits(64) - 2**63)
+        for _ in range(COUNT)
+    ]
+    # Created from strings, long enough to keep no integer
+    length: int = cn.CustomNumber._DIGITWISE_THRESHOLD * 4
+    long = [
+        cn.CustomNumber(sysN, sysN._from_int(random.getrandbits(length * 4)))
+        for _ in range(LONG_COUNT)
+    ]
+
+    def forget() -> None:  # The integers computed by the last run
+        for num in long:
+            num._int = None
+
+    for label, nums in [("64 bit", short), (f"{length} digits", long)]:
+        for name, key in [
+            ("sorted(numbers)", None),
+            ("key=CustomNumber.sort_key", cn.CustomNumber.sort_key),
+        ]:
+            seconds: float = min(
+                timeit.repeat(
+                    lambda: sorted(nums, key=key), setup=forget, number=1, repeat=3
+                )
+            )
+            print(f"{label:<12} {name:<26} {seconds * 1e9 / len(nums):>8.0f} ns/number")
+
+if __name__ == "__main__":
+    main()
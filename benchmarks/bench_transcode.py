@@ -0,0 +1,48 @@
+r"""Benchmark: transcode() against going trough CustomNumber.
+
+Run with:
+    python benchmarks/bench_transcode.py
+"""
+
+import random
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+BASE64: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_."
+PAIRS = [
+    ("01", "0123456789abcdef"),
+    ("0123456789abcdef", "01"),
+    ("0123", BASE64),
+    ("0123456789", "0123456789abcdef"),
+]
+LENGTHS = [100, 10_000, 1_000_000]
+
+
+def main() -> None:
+    for src_digits, dst_digits in PAIRS:
+        src = cn.CustomNumeralSystem(src_digits)
+        dst = cn.CustomNumeralSystem(dst_digits)
+        print(f"base {src.base} -> base {dst.base}")
+        for length in LENGTHS:
+            value: str = "".join(random.choice(src_digits[1:]) for _ in range(length))
+            number: int = 3 if length < 1_000_000 else 1
+
+            def direct():
+                cn.transcode(value, src, dst)
+
+            def trough_int():
+                result = cn.CustomNumber(dst, dst_digits[0])
+                result.from_decimal(cn.CustomNumber(src, value).to_decimal())
+                str(result)
+
+            direct_time: float = min(timeit.repeat(direct, number=1, repeat=number))
+            int_time: float = min(timeit.repeat(trough_int, number=1, repeat=number))
+            print(
+                f"  {length:>9} digits: transcode {direct_time * 1e3:>10.2f} ms,"
+                f" trough int {int_time * 1e3:>10.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
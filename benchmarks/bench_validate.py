@@ -0,0 +1,42 @@
+r"""Benchmark: validate_many() against valid_number() called per value.
+
+Run with:
+    python benchmarks/bench_validate.py
+"""
+
+import random
+import timeit
+
+from custom_numbers import custom_numbers as cn
+
+COUNT: int = 200_000
+
+
+def main() -> None:
+    for digits in ["0123456789ABCDEF", "kje5nCs21Q9vW0KMqc"]:
+        sysN = cn.CustomNumeralSystem(digits)
+        valid = [sysN._from_int(random.getrandbits(64)) for _ in range(COUNT)]
+        invalid = list(valid)
+        for i in random.sample(range(COUNT), COUNT // 100):  # 1% invalid
+            invalid[i] = invalid[i][:-1] + "*"
+
+        print(f"base {sysN.base}")
+        for label, values in [("all valid", valid), ("1% invalid", invalid)]:
+
+            def per_value():
+                return [sysN.valid_number(value) for value in values]
+
+            def batch():
+                return sysN.validate_many(values)
+
+            for name, function in [
+                ("valid_number() per value", per_value),
+                ("validate_many()", batch),
+            ]:
+                seconds: float = min(timeit.repeat(function, number=1, repeat=3))
+                per_number: float = seconds * 1e9 / COUNT
+                print(f"  {label:<11} {name:<26} {per_number:>8.1f} ns/number")
+
+
+if __name__ == "__main__":
+    main()
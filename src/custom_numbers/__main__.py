@@ -0,0 +1,162 @@
+r"""Command line converter: python -m custom_numbers
+
+Reads numbers line by line from the files given (or stdin), converts
+them from one numeral system to another and writes them to stdout, in
+the same order.
+
+Example:
+    # Decimal to a custom numeral system and back
+    python -m custom_numbers --dst paf numbers.txt
+    python -m custom_numbers --src paf < custom.txt
+
+    # Between two alphabets, on 4 processes
+    python -m custom_numbers --src 01 --dst 0123456789abcdef --workers 4 *.txt
+"""
+
+import argparse
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterator, List, Optional, TextIO, Tuple
+
+from custom_numbers import custom_numbers as cn
+
+DECIMAL: str = "0123456789"
+
+# Lines are read, converted and written in chunks of about this many bytes
+CHUNK_SIZE: int = 1 << 20
+
+
+def convert(lines: List[str], src_digits: str, dst_digits: str) -> str:
+    r"""Converts a chunk of lines, returns the output text.
+
+    Empty lines stay empty. Raises ValueError(index of the line, message)
+    for an invalid number.
+    """
+
+    src: cn.CustomNumeralSystem = cn.CustomNumeralSystem.get(src_digits)
+    dst: cn.CustomNumeralSystem = cn.CustomNumeralSystem.get(dst_digits)
+    values: List[str] = [line.strip() for line in lines]
+    converted: Iterator[str] = cn.transcode_many(filter(None, values), src, dst)
+    result: List[str] = []
+    try:
+        for value in values:
+            result.append(value and next(converted))
+    except ValueError as error:
+        raise ValueError(len(result), str(error)) from None
+
+    result.append("")  # For the last newline
+    return "\n".join(result)
+
+
+def convert_chunk(
+    lines: List[str], src_digits: str, dst_digits: str, path: str, line_number: int
+) -> str:
+    r"""convert(), with the file name and the line number in the error."""
+
+    try:
+        return convert(lines, src_digits, dst_digits)
+    except ValueError as error:
+        index, message = error.args
+        name: str = "<stdin>" if path == "-" else path
+        raise ValueError(f"{name}:{line_number + index}: {message}") from None
+
+
+def read_chunks(paths: List[str]) -> Iterator[Tuple[str, int, List[str]]]:
+    r"""The lines of the files, in chunks: (file name, first line number, lines)."""
+
+    for path in paths or ["-"]:
+        stream: TextIO
+        if path == "-":
+            stream = sys.stdin
+        else:
+            stream = open(path, encoding="utf-8")
+        try:
+            line_number: int = 1
+            while True:
+                lines: List[str] = stream.readlines(CHUNK_SIZE)
+                if not lines:
+                    break
+                yield (path, line_number, lines)
+                line_number += len(lines)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def write_parallel(
+    chunks: Iterator[Tuple[str, int, List[str]]],
+    src_digits: str,
+    dst_digits: str,
+    workers: int,
+) -> None:
+    r"""Converts the chunks on a pool of processes, writes them in order.
+
+    Only a few chunks per worker are in flight, so the memory use does
+    not depend on the input size.
+    """
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque["Future[str]"] = deque()
+        for path, line_number, lines in chunks:
+            pending.append(
+                executor.submit(
+                    convert_chunk, lines, src_digits, dst_digits, path, line_number
+                )
+            )
+            if len(pending) >= 2 * workers:
+                sys.stdout.write(pending.popleft().result())
+        while pending:
+            sys.stdout.write(pending.popleft().result())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_numbers",
+        description="Converts numbers, one per line, between numeral systems.",
+    )
+    parser.add_argument(
+        "files", nargs="*", help='Files to read, default (or "-") is stdin.'
+    )
+    parser.add_argument(
+        "--src",
+        default=DECIMAL,
+        help="Digits of the input numeral system, default decimal.",
+    )
+    parser.add_argument(
+        "--dst",
+        default=DECIMAL,
+        help="Digits of the output numeral system, default decimal.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Convert on this many processes, the output order is kept.",
+    )
+    args = parser.parse_args(argv)
+
+    for digits in (args.src, args.dst):
+        try:
+            cn.CustomNumeralSystem(digits)
+        except ValueError as error:
+            parser.error(f"Invalid digits {digits!r}: {error}")
+
+    chunks: Iterator[Tuple[str, int, List[str]]] = read_chunks(args.files)
+    try:
+        if args.workers > 1:
+            write_parallel(chunks, args.src, args.dst, args.workers)
+        else:
+            for path, line_number, lines in chunks:
+                text: str = convert_chunk(lines, args.src, args.dst, path, line_number)
+                sys.stdout.write(text)
+    except (ValueError, OSError) as error:
+        print(f"python -m custom_numbers: {error}", file=sys.stderr)
+        return 1
+    finally:
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
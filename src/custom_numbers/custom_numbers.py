@@ -8,9 +8,34 @@ Project homepage and documentation:
 https://github.com/StrayFeral/custom_numbers
 """
 
-import math
+import bisect
+import copy
+import itertools
+import json
+import os
 import re
-from typing import List
+import tempfile
+import time
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, used only by the batch methods
+    np = None  # type: ignore[assignment]
 
 __version__: str = "1.3.0"
 __author__: str = r"Evgueni Antonov (Evgueni.Antonov@gmail.com)"
@@ -28,6 +53,12 @@ class CustomNumeralSystem:
 
                 Forbidden characters: -, +, *, /, % and space
 
+                Given as bytes, every byte is a digit and the numeral
+                system also works in bytes mode: numbers may be given
+                as bytes, bytearray or memoryview and are validated and
+                converted trough bytes.translate() tables, without
+                decoding them to str.
+
     For the needs of basic validation, the equality and iequality Python
     operators were implemented, so you could compare two objects.
 
@@ -65,35 +96,191 @@ class CustomNumeralSystem:
         sys1 = cn.CustomNumeralSystem("paf")
         sys2 = cn.CustomNumeralSystem("paz")
         sys1 != sys2 # True
+
+        # INTERNING
+        # If you create many numbers, better get the numeral system
+        # trough get(). Equal digits give you one and the same object,
+        # which makes comparing the numbers' numeral systems cheaper.
+        sys1 = cn.CustomNumeralSystem.get("paf")
+        sys2 = cn.CustomNumeralSystem.get("paf")
+        sys1 is sys2 # True
     """
 
+    __slots__ = (
+        "_digits",
+        "_base",
+        "_digit_values",
+        "_valid_digits",
+        "_chunk_size",
+        "_chunk_base",
+        "_table_width",
+        "_table_base",
+        "_digit_table",
+        "_powers",
+        "_numpy_tables",
+        "_transcoders",
+        "_int_table",
+        "_format_spec",
+        "_format_table",
+        "_bytes_digits",
+        "_valid_bytes",
+        "_int_bytes_table",
+        "_invalid_marks",
+        "_invalid_pattern",
+        "__weakref__",
+    )
+
     _FORBIDDENCHARACTERS: str = r"+-*/%\s"
+    _FORBIDDEN_SET: FrozenSet[str] = frozenset("+-*/%")  # Plus any whitespace
+    _CHUNK_LIMIT: int = 2**30
+
+    # Above this many digits the conversions switch to divide-and-conquer.
+    # See benchmarks/bench_conversion.py
+    _DC_THRESHOLD: int = 128
+
+    # The biggest lookup tables of digit groups we build, see
+    # _from_int_small() and _transcoder()
+    _TABLE_LIMIT: int = 4096
+
+    # What int() and format() understand, used for short numbers
+    _INT_DIGITS: str = "0123456789abcdefghijklmnopqrstuvwxyz"
+    _SIGNS: Tuple[Any, ...] = ("+", "-", b"+", b"-")
+    _FORMAT_SPECS: Dict[int, str] = {2: "b", 8: "o", 10: "d", 16: "x"}
+
+    # Interned numeral systems, see get()
+    _registry: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+
+    def __init__(self, digits: Any) -> None:
+        # Bytes mode: the bytes are the digits, as latin-1 characters for
+        # everything which works on str
+        self._bytes_digits: Optional[bytes] = None
+        if isinstance(digits, (bytes, bytearray, memoryview)):
+            self._bytes_digits = bytes(digits)
+            digits = self._bytes_digits.decode("latin-1")
 
-    def __init__(self, digits: str) -> None:
         self._digits: str = digits
         self._base: int = len(digits)
 
         if len(digits) == 0:
             raise ValueError("Empty 'digits' argument given.")
 
-        digit_set = set([x for x in digits])
-        if len(digits) != len(digit_set):
+        # Lookup tables, built once. The digits string itself already is
+        # the value -> digit table, so we only need the reverse one.
+        self._digit_values: Dict[str, int] = {
+            digit: value for value, digit in enumerate(digits)
+        }
+        if len(digits) != len(self._digit_values):
             raise ValueError("Duplicate characters in the 'digits' argument.")
 
+        # What valid_number() accepts: the digits, minus forbidden characters
+        self._valid_digits: FrozenSet[str] = frozenset(
+            digit
+            for digit in digits
+            if digit not in self._FORBIDDEN_SET and not digit.isspace()
+        )
+
+        # Groups of this many digits are rendered at once, with a table of
+        # all of them. Built on first use.
+        self._table_width: int = 1
+        while 1 < self._base ** (self._table_width + 1) <= self._TABLE_LIMIT:
+            self._table_width += 1
+        self._table_base: int = self._base**self._table_width
+        self._digit_table: Optional[List[str]] = None
+
+        # The biggest power of the base (whole groups of digits) that still
+        # fits in a single CPython int "limb", so dividing by it stays cheap.
+        self._chunk_size: int = self._table_width
+        while (
+            1 < self._base ** (self._chunk_size + self._table_width) < self._CHUNK_LIMIT
+        ):
+            self._chunk_size += self._table_width
+        self._chunk_base: int = self._base**self._chunk_size
+
+        # Powers of the base used to split huge numbers. Filled on demand.
+        self._powers: Dict[int, int] = {}
+
+        # The digit tables as NumPy arrays, built on the first batch call
+        self._numpy_tables: Optional[Tuple[Any, Any]] = None
+
+        # Conversions to other numeral systems, see transcode()
+        self._transcoders: Dict[str, Callable[[str], str]] = {}
+
+        # Short numbers are converted by int() and format() in C, after
+        # translating to and from their digits, when the base allows it
+        self._int_table: Optional[Dict[int, int]] = None
+        if 2 <= self._base <= len(self._INT_DIGITS):
+            self._int_table = str.maketrans(digits, self._INT_DIGITS[: self._base])
+        self._format_spec: Optional[str] = self._FORMAT_SPECS.get(self._base)
+        self._format_table: Dict[int, int] = {}
+        if self._format_spec is not None:
+            self._format_table = str.maketrans(self._INT_DIGITS[: self._base], digits)
+
+        # The same for bytes, plus the valid digits to be deleted by
+        # bytes.translate(): whatever is left is invalid
+        self._valid_bytes: bytes = b""
+        self._int_bytes_table: Optional[bytes] = None
+        if self._bytes_digits is not None:
+            self._valid_bytes = "".join(sorted(self._valid_digits)).encode("latin-1")
+            if self._int_table is not None:
+                self._int_bytes_table = bytes.maketrans(
+                    self._bytes_digits, self._INT_DIGITS[: self._base].encode()
+                )
+
+        # For validate_many(): a bytes.translate() table marking the invalid
+        # latin-1 characters with 1, the valid digits with 0. Other text
+        # is searched with a pattern, compiled on first use
+        self._invalid_marks: Optional[bytes] = None
+        if max(self._valid_digits, default="") <= "\xff":
+            self._invalid_marks = bytes(
+                chr(code) not in self._valid_digits for code in range(256)
+            )
+        self._invalid_pattern: Any = None
+
         # I don't think we need to put a limit here. Let the user decide.
         # if self._base > self._MAXBASE:
         #    raise ValueError(f"Unsupported numeral base given {self._base}. Maximum base supported is {self._MAXBASE}.")
 
+    @classmethod
+    def get(cls, digits: str) -> "CustomNumeralSystem":
+        r"""Returns the one shared numeral system for the given digits.
+
+        The numeral system is created on the first call and kept for as
+        long as anything references it.
+        """
+
+        key: Tuple[type, str] = (cls, digits)
+        numeral_system: Optional[CustomNumeralSystem] = cls._registry.get(key)
+        if numeral_system is None:
+            numeral_system = cls(digits)
+            cls._registry[key] = numeral_system
+        return numeral_system
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any]]:
+        r"""Pickle only the digits, the tables are rebuilt on load."""
+        return (self.__class__, (self._bytes_digits or self._digits,))
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        r"""Unpickling of numeral systems pickled by older versions."""
+        self.__init__(state["_digits"])  # type: ignore
+
     def __repr__(self) -> str:
         return self._digits
 
     def __eq__(self, other) -> bool:
         """This compare both the digits and the Base."""
+        if self is other:
+            return True
+        if isinstance(other, CustomNumeralSystem):
+            return self._digits == other._digits
         return self._digits == str(other)
 
     def __ne__(self, other) -> bool:
         """This compare both the digits and the Base."""
-        return self._digits != str(other)
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        r"""Equal to the hash of the digits, as they compare equal."""
+        return hash(self._digits)
 
     @property
     def forbidden_characters(self) -> str:
@@ -103,28 +290,788 @@ class CustomNumeralSystem:
     def base(self) -> int:
         return self._base
 
+    @property
+    def bytes_mode(self) -> bool:
+        r"""Was it created with bytes digits, so it works with bytes numbers."""
+        return self._bytes_digits is not None
+
+    def valid_number(self, number: Any) -> bool:
+        r"""Validation: Is this digit belonging to this numeral system?
+
+        In bytes mode the number may also be bytes, bytearray or memoryview.
+        """
+
+        if len(number) == 0:
+            raise ValueError("Passed an empty string as a 'number' argument.")
+
+        if not isinstance(number, str):
+            # Delete all the valid digits: is anything left?
+            return not self._as_bytes(number).translate(None, self._valid_bytes)
+
+        # Any characters outside the defined set, or forbidden characters?
+        return self._valid_digits.issuperset(number)
+
+    def validate_many(self, values: Iterable[Any], signed: bool = False) -> array:
+        r"""Validates many numbers at once, finding the first invalid digit.
+
+        All the values are joined and scanned in one go, with
+        bytes.translate() and bytes.find() (a pattern for text which is
+        not latin-1).
+
+        Args:
+            values: Numbers as strings, or bytes-like in bytes mode.
+            signed: Accept a leading "+" or "-", as CustomNumber does.
+
+        Returns:
+            An array("q") with the offset of the first invalid character of
+            each value, -1 for the valid ones. An empty value (or a sign
+            only) is invalid at its end.
+        """
+
+        items: List[Any] = values if isinstance(values, list) else list(values)
+        result: array = array("q", [-1]) * len(items)
+        if not items:
+            return result
+
+        # No separators needed, every character is checked on its own
+        text: Any
+        if isinstance(items[0], str):
+            text = "".join(items)
+        elif self._bytes_digits is None:
+            raise ValueError("Bytes numbers need a numeral system with bytes digits.")
+        else:
+            text = b"".join(items)
+
+        starts: Optional[List[int]] = None
+        for position in self._invalid_positions(text):
+            if starts is None:  # Where every value starts in the text
+                starts = list(itertools.accumulate(map(len, items), initial=0))
+            # The last one starting there, the empty values before it are
+            # at the same position
+            i: int = bisect.bisect_right(starts, position) - 1
+            offset: int = position - starts[i]
+            if result[i] < 0 and not (
+                signed and offset == 0 and text[position : position + 1] in self._SIGNS
+            ):
+                result[i] = offset
+
+        if min(map(len, items)) <= signed:  # Maybe values with no digits at all
+            for i, item in enumerate(items):
+                if result[i] >= 0:
+                    continue
+                if len(item) == 0 or signed and len(item) == 1 and item in self._SIGNS:
+                    result[i] = len(item)
+        return result
+
+    def _invalid_positions(self, text: Any) -> Iterator[int]:
+        r"""The positions of the invalid characters in text, str or bytes."""
+
+        marks: Optional[bytes] = None
+        if self._invalid_marks is not None:
+            if isinstance(text, str):
+                try:
+                    marks = text.encode("latin-1")
+                except UnicodeEncodeError:
+                    pass
+            else:
+                marks = text
+        if marks is None:  # Not latin-1, with a pattern then
+            for match in self._get_invalid_pattern().finditer(text):
+                yield match.start()
+            return
+
+        # Every valid digit becomes 0 and everything else 1. Usually all of
+        # them are valid, then the one find() below is all the work
+        marks = marks.translate(self._invalid_marks)
+        position: int = marks.find(1)
+        while position >= 0:
+            yield position
+            position = marks.find(1, position + 1)
+
+    def _get_invalid_pattern(self) -> Any:
+        r"""The pattern matching an invalid character, compiled on first use."""
+
+        if self._invalid_pattern is None:
+            valid: str = re.escape("".join(sorted(self._valid_digits)))
+            self._invalid_pattern = re.compile(f"[^{valid}]")
+        return self._invalid_pattern
+
+    def _as_bytes(self, number: Any) -> Any:
+        r"""A bytes-like number as bytes or bytearray, which can be translated."""
+
+        if self._bytes_digits is None:
+            raise ValueError("Bytes numbers need a numeral system with bytes digits.")
+        if isinstance(number, (bytes, bytearray)):
+            return number
+        return memoryview(number).tobytes()
+
+    def _to_int_bytes(self, value: Any) -> int:
+        r"""Same as _to_int(), for a valid bytes-like number."""
+
+        value = self._as_bytes(value)
+        if self._int_bytes_table is not None and len(value) <= self._DC_THRESHOLD:
+            return int(value.translate(self._int_bytes_table), self._base)
+        return self._to_int(value.decode("latin-1"))
+
+    def _from_int_bytes(self, number: int, width: int = 0) -> bytes:
+        r"""Same as _from_int(), as bytes."""
+        return self._from_int(number, width).encode("latin-1")
+
+    def encode_many(self, numbers: Iterable[int], width: int = 0) -> Any:
+        r"""Converts many integers to numbers of this numeral system at once.
+
+        Args:
+            numbers: Integers. A NumPy integer array is converted with
+                vectorized operations, anything else one by one.
+            width: Pad the numbers with "zeroes" to at least this length.
+
+        Returns:
+            A NumPy array of strings for a NumPy array (of the same shape),
+            else a list of str.
+        """
+
+        if np is not None and isinstance(numbers, np.ndarray):
+            if numbers.ndim != 1:  # Flat, then back to the same shape
+                return self.encode_many(numbers.ravel(), width).reshape(numbers.shape)
+            if numbers.dtype.kind in "iu" and self._base > 1:
+                return self._encode_array(numbers, width)
+            return np.array(self.encode_many(numbers.tolist(), width))
+
+        result: List[str] = []
+        for number in numbers:
+            value: str = self._from_int(abs(number), width)
+            if number < 0:
+                value = f"-{value}"
+            result.append(value)
+        return result
+
+    def decode_many(self, values: Iterable[str]) -> Any:
+        r"""Converts many numbers of this numeral system to integers at once.
+
+        Args:
+            values: Signed numbers, as strings. A NumPy array of strings is
+                converted with vectorized operations, anything else one by one.
+
+        Returns:
+            A NumPy int64 array for a NumPy array (an object array if the
+            numbers may not fit in 64 bits), else a list of int.
+        """
+
+        if np is not None and isinstance(values, np.ndarray):
+            if values.ndim != 1:
+                return self.decode_many(values.ravel()).reshape(values.shape)
+            if values.dtype.kind == "U":
+                return self._decode_array(values)
+            return np.array(self.decode_many(values.tolist()), dtype=object)
+
+        result: List[int] = []
+        for value in values:
+            digits: str = value
+            if value[:1] in ("+", "-"):
+                digits = value[1:]
+            if len(digits) == 0 or not self._valid_digits.issuperset(digits):
+                raise ValueError(f"Invalid number '{value}' for this numeral system.")
+
+            number: int = self._to_int(digits)
+            result.append(-number if value[0] == "-" else number)
+        return result
+
+    def _transcoder(self, numeral_system: Any) -> Callable[[str], str]:
+        r"""A function converting valid unsigned numbers to another numeral system.
+
+        If one base is a power of the other, every digit (or chunk of
+        digits) maps to a fixed chunk of digits of the other system, so it
+        is a table lookup per chunk, in linear time. Otherwise the number
+        goes trough an int, with the divide-and-conquer conversions.
+        """
+
+        if not isinstance(numeral_system, CustomNumeralSystem):
+            return lambda value: numeral_system._from_int(self._to_int(value))
+
+        transcoder: Optional[Callable[[str], str]] = self._transcoders.get(
+            numeral_system._digits
+        )
+        if transcoder is None:
+            transcoder = self._build_transcoder(numeral_system)
+            self._transcoders[numeral_system._digits] = transcoder
+        return transcoder
+
+    def _build_transcoder(
+        self, numeral_system: "CustomNumeralSystem"
+    ) -> Callable[[str], str]:
+        source_base: int = self._base
+        target_base: int = numeral_system._base
+        source_zero: str = self._digits[0]
+        target_zero: str = numeral_system._digits[0]
+
+        def general(value: str) -> str:
+            return numeral_system._from_int(self._to_int(value))
+
+        if source_base < 2 or target_base < 2:
+            return general
+
+        # How many digits of the smaller base make one digit of the bigger
+        small, big = sorted((source_base, target_base))
+        exponent: int = 1
+        power: int = small
+        while power < big:
+            power *= small
+            exponent += 1
+        if power != big:
+            return general
+
+        if source_base >= target_base:
+            # Every digit becomes exponent digits: str.translate() does it
+            expand: Dict[int, str] = {
+                ord(digit): numeral_system._from_int(value, exponent)
+                for value, digit in enumerate(self._digits)
+            }
+
+            def expanding(value: str) -> str:
+                return value.translate(expand).lstrip(target_zero) or target_zero
+
+            return expanding
+
+        # Every exponent digits become one digit. Take several target digits
+        # at once, as long as the table stays small.
+        width: int = 1
+        while target_base ** (width + 1) <= self._TABLE_LIMIT:
+            width += 1
+        chunk: int = width * exponent
+        contract: Dict[str, str] = {
+            self._from_int(value, chunk): numeral_system._from_int(value, width)
+            for value in range(target_base**width)
+        }
+
+        def contracting(value: str) -> str:
+            value = value.rjust(-(-len(value) // chunk) * chunk, source_zero)
+            result: str = "".join(
+                [contract[value[i : i + chunk]] for i in range(0, len(value), chunk)]
+            )
+            return result.lstrip(target_zero) or target_zero
+
+        return contracting
+
+    def _get_numpy_tables(self) -> Tuple[Any, Any]:
+        r"""The digit tables as NumPy arrays.
+
+        Value -> digit: the digits, plus an empty string at the end used
+        as a filler. Digit code -> value: -1 for characters which are not
+        valid digits.
+        """
+
+        if self._numpy_tables is None:
+            value_digits = np.array(list(self._digits) + [""])
+            size: int = max(ord(digit) for digit in self._digits) + 1
+            digit_values = np.full(max(size, 128), -1, dtype=np.int64)
+            for digit in self._valid_digits:
+                digit_values[ord(digit)] = self._digit_values[digit]
+            self._numpy_tables = (value_digits, digit_values)
+        return self._numpy_tables
+
+    def _encode_array(self, numbers: Any, width: int) -> Any:
+        value_digits, _ = self._get_numpy_tables()
+        base = np.uint64(self._base)
+
+        negative = numbers < 0
+        # Two's complement magnitude, correct even for the smallest int64
+        magnitude = numbers.astype(np.uint64)
+        magnitude = np.where(negative, ~magnitude + np.uint64(1), magnitude)
+
+        # One vectorized divmod pass per digit position, least significant first
+        columns = []
+        lengths = np.ones(len(numbers), dtype=np.int64)
+        while True:
+            magnitude, digit = np.divmod(magnitude, base)
+            columns.append(digit.astype(np.int64))
+            remaining = magnitude > 0
+            if not remaining.any():
+                break
+            lengths += remaining
+        while len(columns) < width:
+            columns.append(np.zeros(len(numbers), dtype=np.int64))
+
+        columns.reverse()
+        indexes = np.stack(columns, axis=1)
+        total: int = indexes.shape[1]
+        lengths = np.maximum(lengths, width)
+
+        # Shift every row left, so it starts with its first digit we keep.
+        # The rest is filled with the empty string which NumPy strips.
+        positions = np.arange(total)[np.newaxis, :] + (total - lengths)[:, np.newaxis]
+        shifted = np.take_along_axis(indexes, np.minimum(positions, total - 1), axis=1)
+        shifted[positions >= total] = self._base
+
+        characters = np.ascontiguousarray(value_digits[shifted], dtype="<U1")
+        result = characters.view(f"<U{total}").reshape(len(numbers))
+        if negative.any():
+            result = np.char.add(np.where(negative, "-", ""), result)
+        return result
+
+    def _decode_array(self, values: Any) -> Any:
+        _, digit_values = self._get_numpy_tables()
+        count: int = len(values)
+        total: int = values.dtype.itemsize // 4
+        codes = np.ascontiguousarray(values).view(np.uint32).reshape(count, total)
+
+        # Sign, if any, is in the first column. NUL is NumPy's filler.
+        negative = codes[:, 0] == ord("-") if total else np.zeros(count, bool)
+        skip = codes == 0
+        if total:
+            skip[:, 0] |= negative | (codes[:, 0] == ord("+"))
+
+        table_size: int = len(digit_values)
+        digits = digit_values[np.minimum(codes, table_size - 1)]
+        invalid = ((digits < 0) | (codes >= table_size)) & ~skip
+        lengths = total - skip.sum(axis=1)
+        invalid_rows = invalid.any(axis=1) | (lengths == 0)
+        if invalid_rows.any():
+            row: int = int(np.argmax(invalid_rows))
+            raise ValueError(f"Invalid number '{values[row]}' for this numeral system.")
+
+        # Horner's method, one vectorized pass per digit position. In
+        # uint64, keeping track of anything which may have overflowed.
+        base = np.uint64(self._base)
+        limit = np.uint64((2**64 - self._base) // self._base)
+        overflow = np.zeros(count, dtype=bool)
+        result = np.zeros(count, dtype=np.uint64)
+        for column in range(total):
+            overflow |= (result > limit) & ~skip[:, column]
+            shifted = result * base + digits[:, column].astype(np.uint64)
+            result = np.where(skip[:, column], result, shifted)
+
+        overflow |= result > np.where(negative, np.uint64(2**63), np.uint64(2**63 - 1))
+        if overflow.any():  # Does not fit in int64, do it exactly instead
+            return np.array(self.decode_many(values.tolist()), dtype=object)
+
+        result = result.astype(np.int64)  # -2**63 wraps around to itself
+        return np.where(negative, -result, result)
+
+    def _representable(self, number: int) -> bool:
+        r"""Can this number be written (with a sign) in this numeral system?"""
+        return not number or self._base > 1
+
+    def _power(self, exponent: int) -> int:
+        r"""Cached base**exponent."""
+
+        power: Optional[int] = self._powers.get(exponent)
+        if power is None:
+            power = self._base**exponent
+            self._powers[exponent] = power
+        return power
+
+    def _split_width(self, length: int) -> int:
+        r"""Width of the low part when splitting a number of the given length.
+
+        Always the threshold times a power of two, so numbers of any
+        length end up sharing the same few cached powers.
+        """
+
+        width: int = self._DC_THRESHOLD
+        while width * 2 < length:
+            width *= 2
+        return width
+
+    def _to_int(self, value: str) -> int:
+        r"""Converts an unsigned string of digits to an integer."""
+
+        if len(value) <= self._DC_THRESHOLD:
+            return self._to_int_small(value)
+
+        # Divide-and-conquer, like CPython's own str -> int conversion.
+        # This is multiplication only, so we benefit from Karatsuba.
+        width: int = self._split_width(len(value))
+        high: int = self._to_int(value[:-width])
+        low: int = self._to_int(value[-width:])
+        return high * self._power(width) + low
+
+    def _to_int_small(self, value: str) -> int:
+        if self._int_table is not None:
+            return int(value.translate(self._int_table), self._base)
+
+        digit_values: Dict[str, int] = self._digit_values
+        base: int = self._base
+        int_value = 0
+
+        # Horner's method: no powers of the base needed at all
+        for digit in value:
+            int_value = int_value * base + digit_values[digit]
+
+        return int_value
+
+    def _from_int(self, number: int, width: int = 0) -> str:
+        r"""Converts a non-negative integer to a string of digits.
+
+        If width is given, the result is padded with "zeroes" to it.
+        """
+
+        if number < self._base and width <= 1:
+            return self._digits[number]
+        if self._base == 1:
+            raise ValueError("A base 1 numeral system can only represent zero.")
+
+        pieces: List[str] = []
+        self._from_int_into(number, 0, pieces)
+        return "".join(pieces).rjust(width, self._digits[0])
+
+    def _from_int_into(self, number: int, width: int, pieces: List[str]) -> None:
+        threshold: int = self._DC_THRESHOLD
+
+        if width == 0:  # The most significant part, no padding
+            if number < self._power(threshold):
+                pieces.append(self._from_int_small(number))
+                return
+
+            split: int = threshold
+            while number >= self._power(split * 2):
+                split *= 2
+        else:
+            if width <= threshold:
+                value: str = self._from_int_small(number)
+                pieces.append(value.rjust(width, self._digits[0]))
+                return
+
+            split = self._split_width(width)
+
+        high, low = divmod(number, self._power(split))
+        self._from_int_into(high, width - split if width else 0, pieces)
+        self._from_int_into(low, split, pieces)
+
+    def _from_int_small(self, number: int) -> str:
+        digits: str = self._digits
+        base: int = self._base
+
+        if number < base:
+            return digits[number]
+        if self._format_spec is not None:
+            return format(number, self._format_spec).translate(self._format_table)
+
+        # Strictly integer arithmetic. We peel off whole chunks of digits
+        # with a single small divisor, so the big number is divided once
+        # per chunk and not once per digit. The chunks are split in groups
+        # of digits, rendered by a table lookup.
+        table: List[str] = self._digit_table or self._build_digit_table()
+        table_base: int = self._table_base
+        groups: range = range(self._chunk_size // self._table_width)
+        chunk_base: int = self._chunk_base
+        result: List[str] = []
+        while number:
+            number, chunk = divmod(number, chunk_base)
+            for _ in groups:
+                chunk, group = divmod(chunk, table_base)
+                result.append(table[group])
+
+        result.reverse()
+        return "".join(result).lstrip(digits[0])
+
+    def _build_digit_table(self) -> List[str]:
+        r"""All the groups of _table_width digits, in order."""
+
+        table: List[str] = [""]
+        for _ in range(self._table_width):
+            table = [group + digit for group in table for digit in self._digits]
+        self._digit_table = table
+        return table
+
+    def _add_digits(self, a: str, b: str) -> str:
+        r"""Adds two unsigned numbers without leading zeroes, in O(length).
+
+        Schoolbook addition with carry, on limbs of _DC_THRESHOLD digits:
+        only as far as the shorter number (or the carry) reaches, the rest
+        of the longer one is copied as it is.
+        """
+
+        if len(a) < len(b):
+            a, b = b, a
+        width: int = self._DC_THRESHOLD
+        limit: int = self._power(width)
+        shift: int = len(a) - len(b)  # Where b starts, below a
+        pieces: List[str] = []
+        carry: int = 0
+        end: int = len(a)
+        while end > 0:
+            if end <= shift and not carry:
+                pieces.append(a[:end])
+                break
+            start: int = max(end - width, 0)
+            total: int = self._to_int_small(a[start:end]) + carry
+            if end > shift:
+                total += self._to_int_small(b[max(start - shift, 0) : end - shift])
+            if start == 0:  # The most significant limb may grow
+                pieces.append(self._from_int(total))
+                break
+            carry, total = divmod(total, limit)
+            pieces.append(self._from_int(total, width))
+            end = start
+
+        pieces.reverse()
+        return "".join(pieces)
+
+    def _sub_digits(self, a: str, b: str) -> str:
+        r"""a - b for unsigned numbers without leading zeroes, a >= b.
+
+        The same as _add_digits(), with borrow.
+        """
+
+        width: int = self._DC_THRESHOLD
+        limit: int = self._power(width)
+        shift: int = len(a) - len(b)
+        pieces: List[str] = []
+        borrow: int = 0
+        end: int = len(a)
+        while end > 0:
+            if end <= shift and not borrow:
+                pieces.append(a[:end])
+                break
+            start: int = max(end - width, 0)
+            total: int = self._to_int_small(a[start:end]) - borrow
+            if end > shift:
+                total -= self._to_int_small(b[max(start - shift, 0) : end - shift])
+            if start == 0:
+                pieces.append(self._from_int(total))
+                break
+            borrow = 0
+            if total < 0:
+                total += limit
+                borrow = 1
+            pieces.append(self._from_int(total, width))
+            end = start
+
+        pieces.reverse()
+        return "".join(pieces).lstrip(self._digits[0]) or self._digits[0]
+
+    def _compare_digits(self, a: str, b: str) -> int:
+        r"""Compares two unsigned numbers without leading zeroes: -1, 0 or 1.
+
+        The longer one is bigger, else the first different digit decides.
+        It is found by halving, comparing slices of the strings.
+        """
+
+        if len(a) != len(b):
+            return -1 if len(a) < len(b) else 1
+        if a == b:
+            return 0
+        low: int = 0  # a[:low] == b[:low], and they differ before high
+        high: int = len(a)
+        while high - low > 1:
+            middle: int = (low + high) // 2
+            if a[low:middle] == b[low:middle]:
+                low = middle
+            else:
+                high = middle
+        return -1 if self._digit_values[a[low]] < self._digit_values[b[low]] else 1
+
+
+class MixedRadixNumeralSystem:
+    r"""A numeral system with its own digits at each position.
+
+    Like the car plates with two letters and two digits, or the date coded
+    serial numbers. The numbers have a fixed length, one digit for each
+    position, and the first number is the one with the first digit of
+    every position.
+
+    Args:
+        alphabets: The digits of each position, most significant first.
+                Like the digits of a CustomNumeralSystem, the order of
+                the characters is important and the same forbidden
+                characters apply.
+
+    Works with CustomNumber, CustomRange and GearIterator, same as a
+    CustomNumeralSystem. Conversions are O(length), with the place values
+    computed once.
+
+    Example:
+        plates = cn.MixedRadixNumeralSystem(["ABC", "ABC", "0123456789"])
+        cn.CustomNumber(plates, "AB7").to_decimal()   # 17
+        plates.capacity                               # 90
+    """
+
+    __slots__ = (
+        "_alphabets",
+        "_radices",
+        "_place_values",
+        "_digit_values",
+        "_capacity",
+        "_gears",
+        "__weakref__",
+    )
+
+    def __init__(self, alphabets: Iterable[str]) -> None:
+        self._alphabets: Tuple[str, ...] = tuple(alphabets)
+        if len(self._alphabets) == 0:
+            raise ValueError("Empty 'alphabets' argument given.")
+
+        # Per position lookup tables and place values, least significant
+        # position last, as written
+        self._digit_values: List[Dict[str, int]] = []
+        for alphabet in self._alphabets:
+            # Same validation as CustomNumeralSystem, one alphabet at a time
+            digits: CustomNumeralSystem = CustomNumeralSystem(alphabet)
+            if len(digits._valid_digits) != len(alphabet):
+                raise ValueError(
+                    f"Forbidden characters in the 'alphabets' argument: {alphabet!r}."
+                )
+            self._digit_values.append(digits._digit_values)
+
+        self._radices: Tuple[int, ...] = tuple(map(len, self._alphabets))
+        place_values: List[int] = []
+        place_value: int = 1
+        for radix in reversed(self._radices):
+            place_values.append(place_value)
+            place_value *= radix
+        self._place_values: Tuple[int, ...] = tuple(reversed(place_values))
+        self._capacity: int = place_value
+
+        # (radix, alphabet) of each position, least significant first
+        self._gears: Tuple[Tuple[int, str], ...] = tuple(
+            zip(reversed(self._radices), reversed(self._alphabets))
+        )
+
+    def __reduce__(self) -> Tuple[type, Tuple[Tuple[str, ...]]]:
+        r"""Pickle only the alphabets, the tables are rebuilt on load."""
+        return (self.__class__, (self._alphabets,))
+
+    def __repr__(self) -> str:
+        return f"MixedRadixNumeralSystem({list(self._alphabets)!r})"
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, MixedRadixNumeralSystem):
+            return self._alphabets == other._alphabets
+        return False
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self._alphabets)
+
+    def __len__(self) -> int:
+        r"""The number of positions, i.e. the length of every number."""
+        return len(self._alphabets)
+
+    @property
+    def alphabets(self) -> Tuple[str, ...]:
+        return self._alphabets
+
+    @property
+    def radices(self) -> Tuple[int, ...]:
+        return self._radices
+
+    @property
+    def place_values(self) -> Tuple[int, ...]:
+        return self._place_values
+
+    @property
+    def capacity(self) -> int:
+        r"""How many numbers there are. The biggest one is capacity - 1."""
+        return self._capacity
+
     def valid_number(self, number: str) -> bool:
-        r"""Validation: Is this digit belonging to this numeral system?"""
+        r"""Validation: Is this a number of this numeral system?
+
+        It must have a valid digit at every position.
+        """
 
         if len(number) == 0:
             raise ValueError("Passed an empty string as a 'number' argument.")
 
-        # Test if string contains forbidden characters.
-        # Generally I dislike the + string concatenation, but as an
-        # f-string the regexes triggered some warnings, despite I
-        # escaped them.
-        regex_str = r"[" + re.escape(self._FORBIDDENCHARACTERS) + r"]"
-        regex = re.compile(regex_str)
-        if regex.search(number):
-            return False
+        return len(number) == len(self._alphabets) and all(
+            digit in digit_values
+            for digit, digit_values in zip(number, self._digit_values)
+        )
 
-        # Test if string contains any characters outside the defined set
-        regex_str = r"[^" + re.escape(self._digits) + r"]"
-        regex = re.compile(regex_str)
-        if regex.search(number):
-            return False
+    def _representable(self, number: int) -> bool:
+        return abs(number) < self._capacity
+
+    def _transcoder(self, numeral_system: Any) -> Callable[[str], str]:
+        r"""See CustomNumeralSystem._transcoder(), always trough an int here."""
+        return lambda value: numeral_system._from_int(self._to_int(value))
+
+    def _to_int(self, value: str) -> int:
+        r"""Converts a valid number to int, in O(length)."""
+
+        result: int = 0
+        for digit, digit_values, place_value in zip(
+            value, self._digit_values, self._place_values
+        ):
+            result += digit_values[digit] * place_value
+        return result
+
+    def _indexes(self, number: int) -> List[int]:
+        r"""The digit values, least significant first (the GearIterator order)."""
+
+        if not 0 <= number < self._capacity:
+            raise ValueError(
+                f"{number} is out of the range of the mixed radix numeral system."
+            )
+        indexes: List[int] = []
+        for radix, _ in self._gears:
+            number, index = divmod(number, radix)
+            indexes.append(index)
+        return indexes
+
+    def _from_int(self, number: int, width: int = 0) -> str:
+        r"""Converts a non-negative int, in O(length). Always full length."""
+
+        if not 0 <= number < self._capacity:
+            raise ValueError(
+                f"{number} is out of the range of the mixed radix numeral system."
+            )
+        digits: List[str] = []
+        for radix, alphabet in self._gears:
+            number, index = divmod(number, radix)
+            digits.append(alphabet[index])
+        digits.reverse()
+        return "".join(digits)
+
+
+def transcode(value: str, src_system: Any, dst_system: Any) -> str:
+    r"""Converts a number from one numeral system to another, directly.
+
+    Linear time if one base is a power of the other (e.g. base 2 and
+    base 16), else trough the divide-and-conquer int conversions. No
+    CustomNumber is created.
+
+    Args:
+        value: The number, signed numbers are supported.
+        src_system: The numeral system of the value.
+        dst_system: The numeral system to convert to.
+
+    Example:
+        sys2 = cn.CustomNumeralSystem("01")
+        sys16 = cn.CustomNumeralSystem("0123456789abcdef")
+        cn.transcode("-11111111", sys2, sys16)   # "-ff"
+    """
+
+    return next(transcode_many((value,), src_system, dst_system))
 
-        return True
+
+def transcode_many(
+    values: Iterable[str], src_system: Any, dst_system: Any
+) -> Iterator[str]:
+    r"""Same as transcode(), for many values, as they come.
+
+    The conversion tables are looked up once, so this is the way to
+    convert long streams of values.
+    """
+
+    transcoder: Callable[[str], str] = src_system._transcoder(dst_system)
+    valid_number: Callable[[str], bool] = src_system.valid_number
+    zero: str = dst_system._from_int(0)
+    for value in values:
+        digits: str = value
+        if value[:1] in (CustomNumber._POSITIVE, CustomNumber._NEGATIVE):
+            digits = value[1:]
+        if len(digits) == 0 or not valid_number(digits):
+            raise ValueError(f"Invalid number '{value}' for this numeral system.")
+
+        result: str = transcoder(digits)
+        if value[0] == CustomNumber._NEGATIVE and result != zero:  # No "-0"
+            yield f"{CustomNumber._NEGATIVE}{result}"
+        else:
+            yield result
 
 
 class CustomNumber:
@@ -133,6 +1080,8 @@ class CustomNumber:
     Args:
         numeral_system: The custom numeral system the number is going to be from.
         number: The number as a string. Signed numbers are supported.
+            With a numeral system in bytes mode, also as bytes, bytearray
+            or memoryview, and bytes(number) gives it back as bytes.
 
     Basic math operations are supported trough standard Python operators.
 
@@ -145,133 +1094,545 @@ class CustomNumber:
         numN3 = cn.CustomNumber(sysN, "+a") # A positive number
     """
 
+    # We may have tens of millions of these, so keep them compact: no
+    # __dict__, the sign is the integer's sign and the original value is
+    # stored only if it differs from the cached string.
+    __slots__ = (
+        "_numeral_system",
+        "_int",
+        "_repr",
+        "_init_value",
+        "_digit_buffer",
+    )
+
     _POSITIVE: str = r"+"
     _NEGATIVE: str = r"-"
 
-    def __init__(self, numeral_system: CustomNumeralSystem, number: str) -> None:
-        self._numeral_system: CustomNumeralSystem = numeral_system
-        self._init_value: str = number  # Just in case we will keep the original value
-        self._value: str = number
-        self._sign: str = self._POSITIVE
-        self._value: str = self.__abs__(number)
+    # Numbers longer than this many digits keep only their string until
+    # the integer is needed. Adding and subtracting them works on the
+    # digits, in linear time. See benchmarks/bench_digitwise.py
+    _DIGITWISE_THRESHOLD: int = 512
 
-        if number[0] == self._NEGATIVE:
-            self._sign = self._NEGATIVE
+    def __init__(
+        self,
+        numeral_system: Union[CustomNumeralSystem, MixedRadixNumeralSystem],
+        number: Any,
+    ) -> None:
+        self._numeral_system: Union[CustomNumeralSystem, MixedRadixNumeralSystem] = (
+            numeral_system
+        )
+        # Just in case we will keep the original value.
+        # None means it is the same as self._repr
+        self._init_value: Optional[str] = None
+        # The digits of the absolute value, only for increment()
+        self._digit_buffer: Optional[List[str]] = None
+        if not isinstance(number, str):
+            self._init_bytes(number)
+            return
+
+        value: str = self.__abs__(number)
+
+        if not numeral_system.valid_number(value):
+            raise ValueError(
+                "Invalid characters in number, which are not in the chosen numeral system."
+            )
 
-        if not numeral_system.valid_number(self._value):
+        self._repr: Optional[str] = number
+        if number[0] == self._POSITIVE:
+            self._repr = value
+            self._init_value = number
+
+        # The integer is the canonical value, computed once. The string
+        # is only a cache of its rendering, we already have it here. Long
+        # numbers compute it when needed, see _decimal
+        self._int: Optional[int] = None
+        if len(value) <= self._DIGITWISE_THRESHOLD or not isinstance(
+            numeral_system, CustomNumeralSystem
+        ):
+            self._int = numeral_system._to_int(value)
+            if number[0] == self._NEGATIVE:
+                self._int = -self._int
+
+    def _init_bytes(self, number: Any) -> None:
+        r"""Bytes mode: straight from the bytes to the int, no str involved."""
+
+        if not (
+            isinstance(self._numeral_system, CustomNumeralSystem)
+            and self._numeral_system.bytes_mode
+        ):
+            raise ValueError("Bytes numbers need a numeral system with bytes digits.")
+
+        data: Any = self._numeral_system._as_bytes(number)
+        value: Any = data
+        if data[:1] in (b"+", b"-"):
+            value = data[1:]
+        if not value or not self._numeral_system.valid_number(value):
             raise ValueError(
                 "Invalid characters in number, which are not in the chosen numeral system."
             )
 
+        self._int = self._numeral_system._to_int_bytes(value)
+        if data[:1] == b"-":
+            self._int = -self._int
+        self._repr = None  # Rendered when needed
+        self._init_value = ""
+
+    @classmethod
+    def _from_decimal(
+        cls,
+        numeral_system: Union[CustomNumeralSystem, MixedRadixNumeralSystem],
+        number: int,
+    ) -> "CustomNumber":
+        r"""Internal constructor for results: no validation, no rendering."""
+
+        num: CustomNumber = cls.__new__(cls)
+        num._numeral_system = numeral_system
+        num._init_value = ""  # Not created from a string
+        num._int = number
+        num._repr = None
+        num._digit_buffer = None
+        return num
+
+    @classmethod
+    def _from_digits(
+        cls,
+        numeral_system: Union[CustomNumeralSystem, MixedRadixNumeralSystem],
+        number: str,
+    ) -> "CustomNumber":
+        r"""Internal constructor for digit-wise results: the integer is
+        computed when needed."""
+
+        num: CustomNumber = cls.__new__(cls)
+        num._numeral_system = numeral_system
+        num._init_value = ""
+        num._int = None
+        num._repr = number
+        num._digit_buffer = None
+        return num
+
+    @property
+    def _decimal(self) -> int:
+        r"""The integer value, computed on first use for long numbers."""
+
+        if self._int is None:
+            number: str = self._repr  # type: ignore
+            value: int = self._numeral_system._to_int(self.__abs__(number))
+            self._int = -value if number[0] == self._NEGATIVE else value
+        return self._int
+
+    def __getstate__(self) -> Tuple[object, ...]:
+        return (self._numeral_system, self._int, self._repr, self._init_value)
+
+    def __setstate__(self, state: Any) -> None:
+        if isinstance(state, dict):  # Pickled by an older version
+            number: str = state["_value"]
+            if state["_sign"] == self._NEGATIVE:
+                number = f"{self._NEGATIVE}{number}"
+            self.__init__(state["_numeral_system"], number)  # type: ignore
+            self._init_value = state["_init_value"]
+            return
+
+        (
+            self._numeral_system,
+            self._int,
+            self._repr,
+            self._init_value,
+        ) = state  # type: ignore
+        self._digit_buffer = None
+
     def __repr__(self) -> str:
-        if self._sign == self._NEGATIVE:
-            return f"-{self._value}"
-        return self._value
+        if self._repr is None:  # Rendered on first request only
+            value: str
+            if self._digit_buffer is not None:  # Kept up to date by increment()
+                value = "".join(self._digit_buffer)
+            else:
+                value = self._numeral_system._from_int(abs(self._decimal))
+            if self._decimal < 0:
+                value = f"{self._NEGATIVE}{value}"
+            self._repr = value
+        return self._repr
+
+    def __bytes__(self) -> bytes:
+        r"""The number as bytes, for numeral systems in bytes mode."""
+
+        if not getattr(self._numeral_system, "bytes_mode", False):
+            raise ValueError("Bytes numbers need a numeral system with bytes digits.")
+        return repr(self).encode("latin-1")
 
     @property
-    def numeral_system(self) -> CustomNumeralSystem:
+    def numeral_system(self) -> Union[CustomNumeralSystem, MixedRadixNumeralSystem]:
         return self._numeral_system
 
     @property
     def init_value(self) -> str:
-        r"""Return the value the class was initialized with, as it was originally passed to the class."""
+        r"""Return the value the class was initialized with, as it was originally passed to the class.
+
+        Numbers which are results of operations return their current value.
+        """
+        if not self._init_value:  # Unchanged since created, or a result
+            return repr(self)
         return self._init_value
 
+    def _compare(self, other: Any) -> Any:
+        r"""-1, 0 or 1 if self is less than, equal to or greater than other.
+
+        The integers if both numbers have them. Else the digits, without
+        building any integer: the signs first, then the lengths without
+        leading zeroes, then the digits by their values. NotImplemented
+        if other is not a number.
+
+        The operators check for the integers themselves first, it is the
+        usual case.
+        """
+
+        if not isinstance(other, CustomNumber):
+            return NotImplemented
+        self._check_system(other)
+        a_int: Optional[int] = self._int
+        b_int: Optional[int] = other._int
+        if a_int is None or b_int is None:
+            if self._repr is not None and other._repr is not None:
+                return self._compare_digits(other)
+            a_int = self._decimal
+            b_int = other._decimal
+        return (a_int > b_int) - (a_int < b_int)
+
+    def _compare_digits(self, other: "CustomNumber") -> int:
+        r"""_compare() on the strings of the numbers."""
+
+        # Only long numbers get here, never of a mixed radix system
+        system: CustomNumeralSystem = self._numeral_system  # type: ignore
+        zero: str = system._digits[0]
+        a_repr: str = self._repr  # type: ignore
+        b_repr: str = other._repr  # type: ignore
+        a: str = self.__abs__(a_repr).lstrip(zero)  # "" for zero
+        b: str = self.__abs__(b_repr).lstrip(zero)
+        a_sign: int = (-1 if a_repr[0] == self._NEGATIVE else 1) if a else 0
+        b_sign: int = (-1 if b_repr[0] == self._NEGATIVE else 1) if b else 0
+        if a_sign != b_sign:
+            return -1 if a_sign < b_sign else 1
+        if not a_sign:
+            return 0
+        return system._compare_digits(a, b) * a_sign
+
     def __eq__(self, other) -> bool:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        return self.to_decimal() == other.to_decimal()
+        a: Optional[int] = self._int
+        if a is not None and type(other) is CustomNumber:
+            b: Optional[int] = other._int
+            if b is not None and self._numeral_system is other._numeral_system:
+                return a == b
+        order: Any = self._compare(other)
+        return order if order is NotImplemented else order == 0
 
     def __ne__(self, other) -> bool:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        return self.to_decimal() != other.to_decimal()
+        a: Optional[int] = self._int
+        if a is not None and type(other) is CustomNumber:
+            b: Optional[int] = other._int
+            if b is not None and self._numeral_system is other._numeral_system:
+                return a != b
+        order: Any = self._compare(other)
+        return order if order is NotImplemented else order != 0
 
     def __ge__(self, other) -> bool:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        return self.to_decimal() >= other.to_decimal()
+        a: Optional[int] = self._int
+        if a is not None and type(other) is CustomNumber:
+            b: Optional[int] = other._int
+            if b is not None and self._numeral_system is other._numeral_system:
+                return a >= b
+        order: Any = self._compare(other)
+        return order if order is NotImplemented else order >= 0
 
     def __gt__(self, other) -> bool:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        return self.to_decimal() > other.to_decimal()
+        a: Optional[int] = self._int
+        if a is not None and type(other) is CustomNumber:
+            b: Optional[int] = other._int
+            if b is not None and self._numeral_system is other._numeral_system:
+                return a > b
+        order: Any = self._compare(other)
+        return order if order is NotImplemented else order > 0
 
     def __lt__(self, other) -> bool:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        return self.to_decimal() < other.to_decimal()
+        a: Optional[int] = self._int
+        if a is not None and type(other) is CustomNumber:
+            b: Optional[int] = other._int
+            if b is not None and self._numeral_system is other._numeral_system:
+                return a < b
+        order: Any = self._compare(other)
+        return order if order is NotImplemented else order < 0
 
     def __le__(self, other) -> bool:
-        if self.numeral_system != other.numeral_system:
+        a: Optional[int] = self._int
+        if a is not None and type(other) is CustomNumber:
+            b: Optional[int] = other._int
+            if b is not None and self._numeral_system is other._numeral_system:
+                return a <= b
+        order: Any = self._compare(other)
+        return order if order is NotImplemented else order <= 0
+
+    def __hash__(self) -> int:
+        r"""The hash of the numeral system and the integer value,
+        consistent with ==.
+
+        Numbers from different numeral systems can't be compared, they
+        hash differently so they can share a set or a dict. Don't change
+        a number (+=, from_decimal(), ...) while it is in there.
+        """
+        return hash((self._numeral_system, self._decimal))
+
+    def sort_key(self) -> int:
+        r"""A key for sorted() and friends: the integer value.
+
+        Each number is converted (if ever) once, then the keys are
+        compared as integers, in C:
+            sorted(numbers, key=cn.CustomNumber.sort_key)
+
+        Long numbers created from strings (see _DIGITWISE_THRESHOLD) have
+        no integer yet, sorting them without a key compares their digits
+        and converts nothing.
+        """
+        return self._decimal
+
+    def _check_system(self, other: "CustomNumber") -> None:
+        if (
+            self._numeral_system is not other._numeral_system
+            and self._numeral_system != other._numeral_system
+        ):
             raise ValueError("Numbers must be from the same numeral system.")
-        return self.to_decimal() <= other.to_decimal()
+
+    def _operand(self, other: Any) -> Any:
+        r"""The integer value of an operand: a number of the same numeral
+        system, or an int. NotImplemented for anything else."""
+
+        if isinstance(other, CustomNumber):
+            self._check_system(other)
+            return other._decimal
+        if isinstance(other, int):
+            return other
+        return NotImplemented
+
+    def _check_value(self, number: int) -> None:
+        r"""Results are checked here, not when they are displayed.
+
+        E.g. a negative exponent gives a float, which has no digits.
+        """
+
+        if not isinstance(number, int):
+            raise ValueError(f"{number!r} is not an integer.")
+        if not self._numeral_system._representable(number):
+            raise ValueError(f"{number} can't be represented in this numeral system.")
+
+    def _result(self, number: int) -> "CustomNumber":
+        r"""A new number, see _check_value()."""
+
+        self._check_value(number)
+        return CustomNumber._from_decimal(self._numeral_system, number)
+
+    def _update(self, number: int) -> "CustomNumber":
+        r"""In-place operations change the value, as from_decimal() does."""
+
+        self._check_value(number)
+        if self._init_value is None:  # Keep the original value
+            self._init_value = self._repr
+        self._int = number
+        self._repr = None  # Will be rendered when needed
+        self._digit_buffer = None
+        return self
+
+    def _update_digits(self, number: str) -> "CustomNumber":
+        r"""_update() for digit-wise results."""
+
+        if self._init_value is None:
+            self._init_value = self._repr
+        self._int = None
+        self._repr = number
+        self._digit_buffer = None
+        return self
+
+    def _add_digitwise(self, other: Any, negate: bool) -> Optional[str]:
+        r"""self + other (or self - other) as a string, digit by digit.
+
+        For long numbers which don't have their integer yet. None if
+        other is not a number, or if one of them has only its integer:
+        then it is cheaper to convert the other one to an integer.
+        """
+
+        if not isinstance(other, CustomNumber):
+            return None
+        self._check_system(other)
+        if self._repr is None or other._repr is None:
+            return None
+
+        system: Any = self._numeral_system
+        zero: str = system._digits[0]
+        a: str = self._repr
+        b: str = other._repr
+        a_negative: bool = a[0] == self._NEGATIVE
+        b_negative: bool = (b[0] == self._NEGATIVE) != negate
+        a = self.__abs__(a).lstrip(zero) or zero
+        b = self.__abs__(b).lstrip(zero) or zero
+
+        negative: bool = a_negative
+        result: str
+        if a_negative == b_negative:
+            result = system._add_digits(a, b)
+        elif system._compare_digits(a, b) >= 0:
+            result = system._sub_digits(a, b)
+        else:
+            result = system._sub_digits(b, a)
+            negative = b_negative
+        if negative and result != zero:
+            result = f"{self._NEGATIVE}{result}"
+        return result
 
     def __add__(self, other) -> object:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        result: int = self.to_decimal() + other.to_decimal()
-        num: CustomNumber = CustomNumber(
-            self.numeral_system, str(self.numeral_system)[0]
-        )  # Dummy init_value
-        num.from_decimal(result)
-        return num
+        if self._int is None or getattr(other, "_int", 0) is None:
+            result: Optional[str] = self._add_digitwise(other, False)
+            if result is not None:
+                return CustomNumber._from_digits(self._numeral_system, result)
+
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(self._decimal + value)
+
+    def __radd__(self, other) -> object:
+        return self.__add__(other)
+
+    def __iadd__(self, other) -> object:
+        if self._int is None or getattr(other, "_int", 0) is None:
+            result: Optional[str] = self._add_digitwise(other, False)
+            if result is not None:
+                return self._update_digits(result)
+
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._update(self._decimal + value)
 
     def __sub__(self, other) -> object:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        result: int = self.to_decimal() - other.to_decimal()
-        num: CustomNumber = CustomNumber(
-            self.numeral_system, str(self.numeral_system)[0]
-        )  # Dummy init_value
-        num.from_decimal(result)
-        return num
+        if self._int is None or getattr(other, "_int", 0) is None:
+            result: Optional[str] = self._add_digitwise(other, True)
+            if result is not None:
+                return CustomNumber._from_digits(self._numeral_system, result)
+
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(self._decimal - value)
+
+    def __rsub__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(value - self._decimal)
+
+    def __isub__(self, other) -> object:
+        if self._int is None or getattr(other, "_int", 0) is None:
+            result: Optional[str] = self._add_digitwise(other, True)
+            if result is not None:
+                return self._update_digits(result)
+
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._update(self._decimal - value)
 
     def __mul__(self, other) -> object:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        result: int = self.to_decimal() * other.to_decimal()
-        num: CustomNumber = CustomNumber(
-            self.numeral_system, str(self.numeral_system)[0]
-        )  # Dummy init_value
-        num.from_decimal(result)
-        return num
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(self._decimal * value)
+
+    def __rmul__(self, other) -> object:
+        return self.__mul__(other)
+
+    def __imul__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._update(self._decimal * value)
 
     def __floordiv__(self, other) -> object:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        result: int = self.to_decimal() // other.to_decimal()
-        num: CustomNumber = CustomNumber(
-            self.numeral_system, str(self.numeral_system)[0]
-        )  # Dummy init_value
-        num.from_decimal(result)
-        return num
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(self._decimal // value)
+
+    def __rfloordiv__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(value // self._decimal)
+
+    def __ifloordiv__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._update(self._decimal // value)
 
     def __truediv__(self, other) -> object:
         return self.__floordiv__(other)
 
+    def __rtruediv__(self, other) -> object:
+        return self.__rfloordiv__(other)
+
+    def __itruediv__(self, other) -> object:
+        return self.__ifloordiv__(other)
+
     def __div__(self, other) -> object:
         return self.__floordiv__(other)
 
-    def __pow__(self, other) -> object:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        result: int = self.to_decimal() ** other.to_decimal()
-        num: CustomNumber = CustomNumber(
-            self.numeral_system, str(self.numeral_system)[0]
-        )  # Dummy init_value
-        num.from_decimal(result)
-        return num
-
     def __mod__(self, other) -> object:
-        if self.numeral_system != other.numeral_system:
-            raise ValueError("Numbers must be from the same numeral system.")
-        result: int = self.to_decimal() % other.to_decimal()
-        num: CustomNumber = CustomNumber(
-            self.numeral_system, str(self.numeral_system)[0]
-        )  # Dummy init_value
-        num.from_decimal(result)
-        return num
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(self._decimal % value)
+
+    def __rmod__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(value % self._decimal)
+
+    def __imod__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._update(self._decimal % value)
+
+    def __divmod__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        quotient, remainder = divmod(self._decimal, value)
+        return (self._result(quotient), self._result(remainder))
+
+    def __rdivmod__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        quotient, remainder = divmod(value, self._decimal)
+        return (self._result(quotient), self._result(remainder))
+
+    def __pow__(self, other, modulo=None) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        if modulo is None:
+            return self._result(self._decimal**value)
+        mod: Any = self._operand(modulo)
+        if mod is NotImplemented:
+            return mod
+        return self._result(pow(self._decimal, value, mod))
+
+    def __rpow__(self, other) -> object:
+        value: Any = self._operand(other)
+        if value is NotImplemented:
+            return value
+        return self._result(value**self._decimal)
+
+    def __neg__(self) -> object:
+        return self._result(-self._decimal)
 
     def __abs__(self, number: str = "") -> str:
         """Returns the absolute value."""
@@ -279,7 +1640,7 @@ class CustomNumber:
         num: str = number
 
         if len(number) == 0:
-            num = self._value
+            num = repr(self)
 
         if num[0] == self._POSITIVE or num[0] == self._NEGATIVE:
             num = num[1:]  # Strip sign
@@ -291,46 +1652,256 @@ class CustomNumber:
 
         if len(digit) != 1:
             raise ValueError("Invalid digit. Must be one character.")
-        return str(self._numeral_system).index(digit)
+        system: CustomNumeralSystem = self._digit_system()
+        try:
+            return system._digit_values[digit]
+        except KeyError:
+            raise ValueError(f"Invalid digit '{digit}'.") from None
 
     def int_to_digit(self, i: int) -> str:
-        return str(self.numeral_system)[i]
+        return self._digit_system()._digits[i]
 
-    def to_decimal(self) -> int:
-        r"""Converts a number of a custom numeral system to a decimal integer."""
+    def _digit_system(self) -> CustomNumeralSystem:
+        r"""The numeral system, if the digits are the same at every position."""
 
-        power = 0
-        int_value = 0
+        if not isinstance(self._numeral_system, CustomNumeralSystem):
+            raise ValueError(
+                "The digits of a MixedRadixNumeralSystem depend on the position."
+            )
+        return self._numeral_system
 
-        for digit in self._value[::-1]:
-            int_value += self.digit_to_int(digit) * (self._numeral_system.base**power)
-            power += 1
+    def succ(self) -> "CustomNumber":
+        r"""Adds one in place, see increment()."""
+        return self.increment(1)
 
-        if self._sign == self._NEGATIVE:
-            int_value = -abs(int_value)
+    def pred(self) -> "CustomNumber":
+        r"""Subtracts one in place, see increment()."""
+        return self.increment(-1)
 
-        return int_value
+    def increment(self, k: int = 1) -> "CustomNumber":
+        r"""Adds k in place, returns the number itself.
+
+        The digits are changed from the least significant one, with carry
+        (or borrow), in a buffer which is joined only when the number is
+        displayed. So counting by one is amortized O(1), no conversion of
+        the whole number. The integer value is kept in sync.
+
+        Args:
+            k: The integer to add, negative to subtract.
+        """
+
+        old: int = self._decimal
+        number: int = old + k
+        digits: Optional[List[str]] = self._digit_buffer
+        system: Any = self._numeral_system
+        if digits is None or old < 0 < number or number < 0 < old:
+            # First use, or the sign changes: start over from the int
+            self._update(number)
+            if isinstance(system, CustomNumeralSystem) and system._base > 1:
+                self._digit_buffer = list(system._from_int(abs(number)))
+            return self
+
+        symbols: str = system._digits
+        digit_values: Dict[str, int] = system._digit_values
+        # How the absolute value changes, the sign stays the same here
+        carry: int = k if old > 0 or number > 0 else -k
+        index: int = digit_values[digits[-1]] + carry
+        if 0 <= index < system._base:  # Most of the time only the last one
+            digits[-1] = symbols[index]
+            carry = 0
+        i: int = len(digits) - 1
+        while carry:
+            if i < 0:  # One more digit (or a few)
+                digits[:0] = system._from_int(carry)
+                break
+            carry, index = divmod(digit_values[digits[i]] + carry, system._base)
+            digits[i] = symbols[index]
+            i -= 1
+        if digits[0] == symbols[0] and len(digits) > 1:  # Fewer digits now
+            zeroes: int = 1
+            while zeroes < len(digits) - 1 and digits[zeroes] == symbols[0]:
+                zeroes += 1
+            del digits[:zeroes]
+
+        if self._init_value is None:  # Keep the original value
+            self._init_value = self._repr
+        self._int = number
+        self._repr = None
+        return self
+
+    def to_decimal(self) -> int:
+        r"""Converts a number of a custom numeral system to a decimal integer."""
+
+        return self._decimal
 
     def from_decimal(self, number: int) -> None:
         r"""Converts the number to the current numeral system and sets the internal value to it."""
 
-        sign: str = self._POSITIVE
+        self._update(number)  # Checks that it is a representable int
+
+
+class CustomRange:
+    r"""Like range(), but the values are numbers of a CustomNumeralSystem.
+
+    Nothing is materialized: len() is O(1) (and limited to sys.maxsize, as
+    with range()), membership, index() and random access are O(length of
+    the value), slicing and reversed() return another CustomRange.
+
+    Args:
+        numeral_system: The custom numeral system of the values.
+        start: Where the range starts. A string (signed numbers are
+            supported), a CustomNumber or an int.
+        stop: Where the range stops (excluded). If omitted, the range goes
+            from zero to start, as range() does.
+        step: The difference between two consecutive values, an int.
+            Negative steps count down.
+
+    Example:
+        sysN = cn.CustomNumeralSystem("paf")
+        list(cn.CustomRange(sysN, "a", "aa"))   # ["a", "f", "ap"]
+    """
+
+    __slots__ = ("_numeral_system", "_range")
+
+    def __init__(
+        self,
+        numeral_system: Union[CustomNumeralSystem, MixedRadixNumeralSystem],
+        start: Any,
+        stop: Any = None,
+        step: int = 1,
+    ) -> None:
+        self._numeral_system: Union[CustomNumeralSystem, MixedRadixNumeralSystem] = (
+            numeral_system
+        )
+        if stop is None:
+            start, stop = 0, start
+        numbers: range = range(self._to_int(start), self._to_int(stop), step)
+        if numbers and not (
+            numeral_system._representable(numbers[0])
+            and numeral_system._representable(numbers[-1])
+        ):
+            raise ValueError("The range doesn't fit in the numeral system.")
+        self._range: range = numbers
+
+    @classmethod
+    def _from_range(
+        cls,
+        numeral_system: Union[CustomNumeralSystem, MixedRadixNumeralSystem],
+        numbers: range,
+    ) -> "CustomRange":
+        r"""Internal constructor for slices and reversed ranges."""
+
+        result: CustomRange = cls.__new__(cls)
+        result._numeral_system = numeral_system
+        result._range = numbers
+        return result
+
+    def _to_int(self, value: Any) -> int:
+        r"""The integer value of a bound, or of a value to look up."""
+
+        if isinstance(value, int):
+            return value
+        if isinstance(value, CustomNumber):
+            if (
+                self._numeral_system is not value._numeral_system
+                and self._numeral_system != value._numeral_system
+            ):
+                raise ValueError("Numbers must be from the same numeral system.")
+            return value._decimal
+        if not isinstance(value, str):
+            raise TypeError(f"Expected a str, CustomNumber or int, got {value!r}.")
+
+        number: str = value
+        if number[:1] in (CustomNumber._POSITIVE, CustomNumber._NEGATIVE):
+            number = number[1:]
+        if not number or not self._numeral_system.valid_number(number):
+            raise ValueError(
+                "Invalid characters in number, which are not in the chosen numeral system."
+            )
+        result: int = self._numeral_system._to_int(number)
+        return -result if value[0] == CustomNumber._NEGATIVE else result
+
+    def _from_int(self, number: int) -> str:
         if number < 0:
-            sign = self._NEGATIVE
-        self._sign = sign
+            return f"{CustomNumber._NEGATIVE}{self._numeral_system._from_int(-number)}"
+        return self._numeral_system._from_int(number)
 
-        value: str = ""
-        num = float(abs(number))
-        while int(num) > 0:
-            num = num / self.numeral_system.base
-            remainder, integr = math.modf(num)
-            remainder *= self.numeral_system.base
-            value = f"{self.int_to_digit(int(remainder))}{value}"
+    @property
+    def numeral_system(self) -> Union[CustomNumeralSystem, MixedRadixNumeralSystem]:
+        return self._numeral_system
 
-        if number == 0:
-            value = f"{self.int_to_digit(0)}"
+    @property
+    def start(self) -> str:
+        return self._from_int(self._range.start)
 
-        self._value = value
+    @property
+    def stop(self) -> str:
+        return self._from_int(self._range.stop)
+
+    @property
+    def step(self) -> int:
+        return self._range.step
+
+    def __repr__(self) -> str:
+        system: str = repr(self._numeral_system)
+        if isinstance(self._numeral_system, CustomNumeralSystem):
+            system = repr(system)  # Just the digits, quoted
+        step: str = f", {self.step}" if self.step != 1 else ""
+        return f"CustomRange({system}, {self.start!r}, {self.stop!r}{step})"
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __bool__(self) -> bool:
+        return bool(self._range)
+
+    def __iter__(self) -> Iterator[str]:
+        from_int: Callable[[int], str] = self._numeral_system._from_int
+        if not self._range or min(self._range[0], self._range[-1]) >= 0:
+            return map(from_int, self._range)  # No signs to care about
+        return map(self._from_int, self._range)
+
+    def __reversed__(self) -> "CustomRange":
+        return self._from_range(self._numeral_system, self._range[::-1])
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice):
+            return self._from_range(self._numeral_system, self._range[key])
+        return self._from_int(self._range[key])
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            return self._to_int(value) in self._range
+        except (TypeError, ValueError):  # Not a number of this numeral system
+            return False
+
+    def index(self, value: Any) -> int:
+        r"""The position of the value in the range. ValueError if missing."""
+
+        number: int = self._to_int(value)
+        if number not in self._range:
+            raise ValueError(f"{value!r} is not in range.")
+        return self._range.index(number)
+
+    def count(self, value: Any) -> int:
+        return int(value in self)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CustomRange):
+            return NotImplemented
+        return (
+            self._numeral_system == other._numeral_system
+            and self._range == other._range
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._numeral_system, self._range))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            self.__class__._from_range,
+            (self._numeral_system, self._range),
+        )
 
 
 class GearIterator:
@@ -348,6 +1919,15 @@ class GearIterator:
         start_value: Value to start iterating from
         end_value: Value to end the iteration, non-inclusive.
             This will ignore the max_length if set
+        step: Return every step-th value only, default is 1
+        reverse: Count down, the same values in reverse order, down to
+            the start_value. Needs max_length or end_value
+        pattern: Generate only the values matching the pattern, e.g.
+            "ab?[0-3]?". "?" is any digit, "[...]" is any of the listed
+            digits, where "0-3" are the digits from "0" to "3" in the
+            order of the numeral system. A backslash escapes the next
+            character, anything else is a fixed digit. Replaces
+            min_length, max_length, start_value and end_value
 
     Returns:
         str
@@ -356,14 +1936,52 @@ class GearIterator:
     # Nobody would need that much, but still
     _ABSOLUTE_MAX_LEN = 999999999999999999999999999999  # Funny eh?
 
+    _STATE_VERSION: int = 4
+
+    # Defaults for iterators pickled by older versions
+    _step: int = 1
+    _reverse: bool = False
+    _pattern: Optional[str] = None
+    _mixed: Optional[MixedRadixNumeralSystem] = None
+
+    # Checkpointing, see checkpoint(). Off by default: the countdown of
+    # steps until the next checkpoint (or time check) never runs out.
+    _CHECKPOINT_OFF: int = 2**62
+    _CHECKPOINT_POLL: int = 4096  # Steps between time checks
+    _checkpoint_path: Optional[str] = None
+    _checkpoint_every: int = 0
+    _checkpoint_interval: float = 0.0
+    _checkpoint_time: float = 0.0
+    _checkpoint_steps: int = 0  # Since the last write
+    _checkpoint_budget: int = _CHECKPOINT_OFF  # What the countdown started at
+    _checkpoint_countdown: int = _CHECKPOINT_OFF
+
     def __init__(
         self,
-        numeral_system: CustomNumeralSystem,
+        numeral_system: Union[CustomNumeralSystem, MixedRadixNumeralSystem],
         min_length: int = 0,
         max_length: int = _ABSOLUTE_MAX_LEN,
         start_value: str = "",
         end_value: str = "",
+        step: int = 1,
+        reverse: bool = False,
+        pattern: Optional[str] = None,
     ) -> None:
+        mixed: bool = isinstance(numeral_system, MixedRadixNumeralSystem)
+        if mixed and pattern is not None:
+            raise ValueError("pattern needs a CustomNumeralSystem.")
+        if (mixed or pattern is not None) and (
+            min_length
+            or max_length not in (0, self._ABSOLUTE_MAX_LEN)
+            or start_value
+            or end_value
+        ):
+            raise ValueError(
+                "pattern and mixed radix numeral systems can't be combined with min_length, max_length, start_value or end_value."
+            )
+        if mixed or pattern is not None:
+            max_length = 1  # Bounded, the real length comes later
+
         if max_length == 0:
             max_length = self._ABSOLUTE_MAX_LEN
 
@@ -372,15 +1990,18 @@ class GearIterator:
         if len(end_value) > 0:
             max_length = self._ABSOLUTE_MAX_LEN
 
-        self._numeral_system: CustomNumeralSystem = numeral_system
-        self._symbol_list: List[str] = [x for x in str(numeral_system)]
+        self._numeral_system: Union[
+            CustomNumeralSystem, MixedRadixNumeralSystem
+        ] = numeral_system
         self._min_length: int = min_length
         self._max_length: int = max_length
         self._start_value: str = start_value
         self._start_value_returned: bool = False
-        self._index: int = 0
         self._combinations: int = 0
         self._end_value: str = end_value
+        self._step: int = step
+        self._reverse: bool = reverse
+        self._pattern: Optional[str] = pattern
 
         # Basic validation ...
         if max_length > self._ABSOLUTE_MAX_LEN:
@@ -391,6 +2012,14 @@ class GearIterator:
         if max_length > 0 and min_length > max_length:
             raise ValueError("min_length is greather than max_length.")
 
+        if step < 1:
+            raise ValueError("step must be at least 1.")
+
+        if reverse and max_length == self._ABSOLUTE_MAX_LEN and len(end_value) == 0:
+            raise ValueError("Can't reverse without max_length or end_value.")
+
+        zero: str = str(numeral_system)[0]
+
         if len(start_value) > 0:
             if len(start_value) < min_length or (
                 max_length > 0 and len(start_value) > max_length
@@ -402,48 +2031,270 @@ class GearIterator:
                     "Invalid characters in start_value, which are not in the chosen numeral system."
                 )
 
-            if start_value == str(numeral_system)[0] * len(start_value):
+            if start_value == zero * len(start_value):
                 raise ValueError(
                     "start_value contains only smallest digits (zero-equivalents)."
                 )
 
             # Strip the leading "zeroes"
-            while start_value[0] == str(numeral_system)[0]:
-                start_value = start_value[1:]
-
+            start_value = start_value.lstrip(zero)
             self._start_value = start_value[::-1]  # Reverse the string
 
-            if len(end_value) > 0:
-                start_val: CustomNumber = CustomNumber(numeral_system, start_value)
-                end_val: CustomNumber = CustomNumber(numeral_system, end_value)
-                if start_val > end_val:
-                    raise ValueError("start_value is greather than the end_value.")
+        if len(end_value) > 0:
+            if not numeral_system.valid_number(end_value):
+                raise ValueError(
+                    "Invalid characters in end_value, which are not in the chosen numeral system."
+                )
+            start_number: int = numeral_system._to_int(start_value or zero)
+            if start_number > numeral_system._to_int(end_value):
+                raise ValueError("start_value is greather than the end_value.")
+
+        self._setup()
+        self._set_value(self._first)
+
+    def _setup(self) -> None:
+        r"""Everything derived from the arguments."""
+
+        self._digits: str = str(self._numeral_system)
+        self._base: int = len(self._digits)
+        self._width: int = max(self._min_length, 1)
+
+        # The gears, the output and their value, set by _set_value()
+        self._indexes: List[int] = []
+        self._buffer: List[str] = []
+        self._value: int = 0
+
+        if self._pattern is not None:
+            self._mixed = MixedRadixNumeralSystem(self._parse_pattern(self._pattern))
+        elif isinstance(self._numeral_system, MixedRadixNumeralSystem):
+            self._mixed = self._numeral_system
+        if self._mixed is not None:
+            self._setup_mixed()
+            self._setup_steps()
+            return
+
+        # The first value as an integer and where we have to stop: the
+        # end_value, or when we run out of gears
+        self._origin: int = self._numeral_system._to_int(
+            self._start_value[::-1] or self._digits[0]
+        )
+        self._stop: Optional[int] = None
+        if len(self._end_value) > 0:
+            self._stop = self._numeral_system._to_int(self._end_value)
+        elif self._max_length != self._ABSOLUTE_MAX_LEN:
+            self._stop = self._base**self._max_length
+        self._setup_steps()
+
+    def _setup_mixed(self) -> None:
+        r"""Mixed radix (and pattern) mode: every gear has its own digits.
+
+        With a pattern, the value is then the ordinal of the combination
+        of the gears, not a number of the original numeral system.
+        """
+
+        mixed: MixedRadixNumeralSystem = self._mixed  # type: ignore
+        # Least significant first, like the gears
+        self._alphabets: List[str] = list(mixed.alphabets[::-1])
+        self._radices: List[int] = list(mixed.radices[::-1])
+        self._width = len(mixed)
+        self._origin = 0
+        self._stop = mixed.capacity
+
+        # The first gear is the one which moves most, see __next__()
+        self._digits = self._alphabets[0]
+        self._base = self._radices[0]
 
-        min_len: int = min_length
-        if min_len == 0:
-            min_len = 1
+    def _parse_pattern(self, pattern: str) -> List[str]:
+        r"""The digits allowed at each position of the pattern, in order."""
 
-        self._gears: List[list] = []
+        # Never a mixed radix system, see __init__()
+        system: CustomNumeralSystem = self._numeral_system  # type: ignore
+        digit_values: Dict[str, int] = system._digit_values
 
-        # Initialization with start_value
-        for symbol in self._start_value:
-            seq = self._symbol_list.copy()
+        def digit(character: str) -> str:
+            if character not in system._valid_digits:
+                raise ValueError(
+                    f"Invalid digit '{character}' in pattern, not in the chosen numeral system."
+                )
+            return character
+
+        alphabets: List[str] = []
+        i: int = 0
+        while i < len(pattern):
+            character: str = pattern[i]
+            i += 1
+            if character == "?":
+                alphabets.append(system._digits)
+                continue
+            if character == "\\" and i < len(pattern):
+                alphabets.append(digit(pattern[i]))
+                i += 1
+                continue
+            if character != "[":
+                alphabets.append(digit(character))
+                continue
+
+            end: int = pattern.find("]", i + 1)  # "[]...]" lists "]"
+            if end < 0:
+                raise ValueError("Unterminated '[' in pattern.")
+            allowed: List[int] = []
+            members: str = pattern[i:end]
+            j: int = 0
+            while j < len(members):
+                if j + 2 < len(members) and members[j + 1] == "-":
+                    low: int = digit_values[digit(members[j])]
+                    high: int = digit_values[digit(members[j + 2])]
+                    if low > high:
+                        raise ValueError(f"Invalid range '{members[j:j + 3]}' in pattern.")
+                    allowed.extend(range(low, high + 1))
+                    j += 3
+                else:
+                    allowed.append(digit_values[digit(members[j])])
+                    j += 1
+            # In the order of the numeral system, once each
+            alphabets.append("".join(system._digits[x] for x in sorted(set(allowed))))
+            i = end + 1
+
+        if not alphabets:
+            raise ValueError("Empty pattern.")
+        return alphabets
+
+    def _setup_steps(self) -> None:
+        r"""Everything derived from the bounds, the step and the direction.
+
+        The values are _first + ordinal * _delta, up to _last.
+        """
+
+        count: Optional[int] = self._count()
+        self._delta: int = -self._step if self._reverse else self._step
+        self._first: int = self._origin
+        if self._reverse:  # The same values as forwards, like reversed(range())
+            self._first = self._origin + (count - 1) * self._step  # type: ignore
+
+        # The step as digits, least significant first, added to the gears
+        # (negative when counting down). A step beyond the last gear can't
+        # be taken anyway.
+        self._step_indexes: List[int] = []
+        step: int = self._step
+        if self._mixed is None:
+            while step and self._base > 1:
+                step, digit = divmod(step, self._base)
+                self._step_indexes.append(-digit if self._reverse else digit)
+        else:
+            for radix in self._radices:
+                if not step:
+                    break
+                step, digit = divmod(step, radix)
+                self._step_indexes.append(-digit if self._reverse else digit)
+
+        self._last: Optional[int] = None
+        if count is not None:
+            self._last = self._first + (count - 1) * self._delta
+
+    def _set_value(self, value: int) -> None:
+        r"""Sets the gears to the given value."""
+
+        if self._mixed is not None:
+            self._indexes = self._mixed._indexes(value)
+            self._buffer = [
+                alphabet[index] for alphabet, index in zip(self._alphabets, self._indexes)
+            ][::-1]
+            self._value = value
+            return
+
+        system: CustomNumeralSystem = self._numeral_system  # type: ignore
+        number: str = system._from_int(value, self._width)
+        digit_values: Dict[str, int] = system._digit_values
+
+        # The gears, least significant first. Each gear is just the index
+        # of the digit it currently shows.
+        self._indexes = [digit_values[digit] for digit in reversed(number)]
+
+        # The output, most significant digit first. Changed in place,
+        # only where the gears moved.
+        self._buffer = list(number)
+        self._value = value
+
+    def _count(self) -> Optional[int]:
+        r"""How many values in total, None if unlimited."""
+
+        if self._stop is None:
+            return None
+        count: int = max(self._stop - self._origin, 1)  # The first is always returned
+        return -(-count // self._step)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        r"""Pickling and copy.copy(), without the checkpointing: a copy
+        would overwrite the checkpoints of this iterator."""
+
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if not name.startswith("_checkpoint")
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        r"""Unpickling. Also accepts iterators pickled by older versions."""
+
+        gears: Optional[List[List[str]]] = state.pop("_gears", None)
+        for name, attribute in state.items():
+            if not name.startswith("_checkpoint"):  # Pickled before __getstate__()
+                setattr(self, name, attribute)
+        if gears is not None:  # The old gears were lists of the digits left
+            symbols: List[str] = state["_symbol_list"]
+            self._setup()
+            value: int = 0
+            for gear in reversed(gears):
+                value = value * self._base + symbols.index(gear[0])
+            self._set_value(value)
+
+    @property
+    def position(self) -> int:
+        r"""The ordinal of the next value, i.e. how many values were returned.
+
+        The first value (the start_value) has ordinal zero.
+        """
+
+        return (self._value - self._first) // self._delta + self._start_value_returned
+
+    def seek(self, ordinal: int) -> None:
+        r"""Moves the iterator, so the next value returned has the given ordinal.
+
+        Computed directly, in O(length). No stepping.
+        """
 
-            while seq[0] != symbol:
-                seq.pop(0)
+        count: Optional[int] = self._count()
+        if ordinal < 0 or (count is not None and ordinal > count):
+            raise IndexError("GearIterator ordinal out of range.")
 
-            self._gears.append(seq)
+        if ordinal == count:  # Exhausted: the last value was already returned
+            self._set_value(self._first + (ordinal - 1) * self._delta)
+            self._start_value_returned = True
+        else:
+            self._set_value(self._first + ordinal * self._delta)
+            self._start_value_returned = False
+
+    def skip(self, n: int) -> None:
+        r"""Skips n values (goes back if negative), in O(length)."""
+
+        self.seek(self.position + n)
 
-        # Additional initialization until min_length is reached
-        for i in range(len(self._gears), min_len):
-            seq = self._symbol_list.copy()
+    def __getitem__(self, ordinal: int) -> str:
+        r"""The value with the given ordinal, without moving the iterator.
+
+        Negative ordinals count from the end, if there is an end.
+        """
 
-            if len(self._start_value) > 0 and i < len(self._start_value):
-                symbol = self._start_value[i]
-                while seq[0] != symbol:
-                    seq.pop(0)
+        count: Optional[int] = self._count()
+        if ordinal < 0 and count is not None:
+            ordinal += count
+        if ordinal < 0 or (count is not None and ordinal >= count):
+            raise IndexError("GearIterator ordinal out of range.")
 
-            self._gears.append(seq)
+        value: int = self._first + ordinal * self._delta
+        if self._mixed is not None:
+            return self._mixed._from_int(value)
+        return self._numeral_system._from_int(value, self._width)
 
     @property
     def combinations(self) -> int:
@@ -459,24 +2310,42 @@ class GearIterator:
         And while for mathematicians "01" == "10", for me they are not
         the same.
 
-        This would give furious results with the default value, so
-        better set max_length if you want cool results here.
+        This is the exact number of values for the configured bounds:
+        shorter values are padded to min_length, so every number from
+        the start_value up to the end (base**max_length or the end_value)
+        is one value. No need to enumerate anything.
+
+        Raises ValueError for an unlimited iterator, better set
+        max_length or end_value if you want cool results here.
         """
 
         if self._combinations == 0:
-            n: int = len(self._symbol_list)
-            r: int = self._max_length
-            c: int = n * r
+            count: Optional[int] = self._count()
+            if count is None:
+                raise ValueError("Unlimited GearIterator, no max_length or end_value.")
 
-            self._combinations = c
+            self._combinations = count
 
         return self._combinations
 
+    def remaining(self) -> int:
+        r"""How many values are left, in O(1)."""
+
+        return self.combinations - self.position
+
+    def __len__(self) -> int:
+        r"""Same as remaining(), so it decreases as the iteration goes."""
+
+        if self._count() is None:
+            raise TypeError("Unlimited GearIterator has no len().")
+        return self.remaining()
+
+    def __bool__(self) -> bool:
+        r"""Always true, like any iterator, even if it has a len() of zero."""
+        return True
+
     def __repr__(self) -> str:
-        result: str = ""
-        for gear in self._gears:
-            result += gear[0]
-        return result[::-1]  # Reverse the string
+        return "".join(self._buffer)
 
     def __iter__(self) -> object:
         return self
@@ -485,36 +2354,447 @@ class GearIterator:
     def __next__(self) -> str:
         if not self._start_value_returned:
             self._start_value_returned = True
-            return repr(self)
-        
-        if len(self._end_value) > 0 and repr(self) == self._end_value:
+            return "".join(self._buffer)
+
+        if self._value == self._last:
             raise StopIteration
 
-        spin_wheels: bool = True
-        i = 0
-        while spin_wheels:
-            self._gears[i].pop(0)
+        indexes: List[int] = self._indexes
+        buffer: List[str] = self._buffer
+        self._value += self._delta
 
-            # Reset gear
-            if len(self._gears[i]) == 0:
-                self._gears[i] = self._symbol_list.copy()
-                i += 1
+        # Most of the time only the first gear moves
+        index: int = indexes[0] + self._delta
+        if 0 <= index < self._base:
+            indexes[0] = index
+            buffer[-1] = self._digits[index]
+        else:
+            self._advance()
+
+        self._checkpoint_countdown -= 1
+        if self._checkpoint_countdown <= 0:
+            self._checkpoint(1)
+
+        return "".join(buffer)
+
+    def shards(self, n: int) -> List["GearIterator"]:
+        r"""Splits the values not returned yet into n contiguous parts.
+
+        The parts do not overlap and their sizes differ by at most one.
+        Each one is an independent (and picklable) GearIterator. If there
+        are fewer than n values left, there are fewer parts, never empty
+        ones. This iterator is not changed.
+        """
+
+        count: Optional[int] = self._count()
+        if count is None:
+            raise ValueError("Can't split an unlimited GearIterator.")
+        if n < 1:
+            raise ValueError("Number of shards must be at least 1.")
+
+        first: int = self.position
+        remaining: int = count - first
+        n = min(n, remaining)
+        if n == 0:  # Exhausted
+            return []
+        size, bigger = divmod(remaining, n)
+
+        result: List[GearIterator] = []
+        for i in range(n):
+            last: int = first + size + (i < bigger)
+            result.append(self._shard(first, last))
+            first = last
+        return result
+
+    def _shard(self, first: int, stop: int) -> "GearIterator":
+        r"""A copy of this iterator, for the ordinals from first to stop."""
+
+        # The bounds are the lowest and past the highest value, either way
+        value1: int = self._first + first * self._delta
+        value2: int = self._first + (stop - 1) * self._delta
+        shard: GearIterator = copy.copy(self)  # Without the checkpointing
+        shard._rebase(min(value1, value2), max(value1, value2) + 1)
+        return shard
+
+    def _rebase(self, first: int, stop: Optional[int]) -> None:
+        r"""Makes this iterator go from first to stop, from the beginning."""
+
+        if self._mixed is None:
+            zero: str = self._digits[0]
+            self._start_value = self._numeral_system._from_int(first).lstrip(zero)[::-1]
+        if stop is not None and self._mixed is None:
+            self._end_value = self._numeral_system._from_int(stop)
+            self._max_length = self._ABSOLUTE_MAX_LEN
+        self._start_value_returned = False
+        self._combinations = 0
+        self._origin = first
+        self._stop = stop
+        self._setup_steps()
+        self._set_value(self._first)
+
+    def state(self) -> bytes:
+        r"""A compact snapshot of the iteration: the settings and the position.
+
+        Restore it with GearIterator.from_state().
+        """
+
+        return self._state(self.position)
+
+    def _state(self, position: int) -> bytes:
+        r"""state(), at the given position."""
+
+        max_length: int = self._max_length
+        if max_length == self._ABSOLUTE_MAX_LEN:
+            max_length = 0
+
+        digits: Any = str(self._numeral_system)
+        bytes_mode: bool = getattr(self._numeral_system, "bytes_mode", False)
+        if isinstance(self._numeral_system, MixedRadixNumeralSystem):
+            digits = self._numeral_system.alphabets
+
+        state: List[Any] = [
+            self._STATE_VERSION,
+            digits,
+            self._min_length,
+            max_length,
+            self._origin,
+            self._stop,
+            position,
+            self._step,
+            self._reverse,
+            self._pattern,
+            bytes_mode,  # Then the digits are the bytes, as latin-1
+        ]
+        return json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode()
+
+    @classmethod
+    def from_state(cls, state: bytes) -> "GearIterator":
+        r"""Restores an iterator from what state() returned."""
+
+        fields: List[Any] = json.loads(state)
+        if not 1 <= fields[0] <= cls._STATE_VERSION:
+            raise ValueError(f"Unsupported GearIterator state version {fields[0]}.")
+        fields += [1, False, None, False][len(fields) - 7 :]  # Added by later versions
+        (_, digits, min_length, max_length, origin, stop, position) = fields[:7]
+        step, reverse, pattern, bytes_mode = fields[7:]
+        if bytes_mode:
+            digits = digits.encode("latin-1")
+
+        it: GearIterator
+        if isinstance(digits, list):  # The alphabets of a mixed radix system
+            it = cls(MixedRadixNumeralSystem(digits))
+        elif pattern is None:
+            it = cls(CustomNumeralSystem(digits), min_length, max_length)
+        else:
+            it = cls(CustomNumeralSystem(digits), pattern=pattern)
+        it._step = step
+        it._reverse = reverse
+        it._rebase(origin, stop)
+        it.seek(position)
+        return it
+
+    @classmethod
+    def resume(cls, path: str) -> "GearIterator":
+        r"""Restores an iterator from a file written by write_state()."""
+
+        with open(path, "rb") as stream:
+            return cls.from_state(stream.read())
+
+    def checkpoint(
+        self, path: Optional[str], every: int = 0, interval: float = 0.0
+    ) -> None:
+        r"""Saves the state() to a file automatically, as the iteration goes.
+
+        The file is replaced atomically, so it is always a complete state.
+        Resume with GearIterator.resume(path).
+        The values returned by the call which wrote the last checkpoint
+        (and any later ones) are returned again.
+
+        Args:
+            path: The file to write to. None turns checkpointing off.
+            every: Write every this many steps.
+            interval: Write every this many seconds (checked every few
+                thousand steps).
+        """
+
+        if path is None:
+            self._checkpoint_path = None
+            self._checkpoint_countdown = self._CHECKPOINT_OFF
+            return
+        if every <= 0 and interval <= 0:
+            raise ValueError("Set at least one of every and interval.")
+
+        self._checkpoint_path = path
+        self._checkpoint_every = every
+        self._checkpoint_interval = interval
+        self._checkpoint_time = time.monotonic()
+        self._checkpoint_steps = 0
+        self._checkpoint_countdown = self._next_checkpoint_countdown()
+
+    def _next_checkpoint_countdown(self) -> int:
+        r"""Steps until the next write, or the next time check."""
+
+        countdown: int = self._CHECKPOINT_OFF
+        if self._checkpoint_every > 0:
+            countdown = self._checkpoint_every - self._checkpoint_steps
+        if self._checkpoint_interval > 0:
+            countdown = min(countdown, self._CHECKPOINT_POLL)
+        self._checkpoint_budget = countdown
+        return countdown
+
+    def _checkpoint(self, pending: int) -> None:
+        r"""Called when the checkpoint countdown runs out.
+
+        The last pending values are not returned yet (this call returns
+        them), so the state is saved as before them: after a crash they
+        are returned again, not lost.
+        """
+
+        if self._checkpoint_path is None:  # Just a very long iteration
+            self._checkpoint_countdown = self._CHECKPOINT_OFF
+            return
+
+        self._checkpoint_steps += self._checkpoint_budget - self._checkpoint_countdown
+        now: float = time.monotonic()
+        if (0 < self._checkpoint_every <= self._checkpoint_steps) or (
+            0 < self._checkpoint_interval <= now - self._checkpoint_time
+        ):
+            state: bytes = self._state(self.position - pending)
+            self._write_state(self._checkpoint_path, state)
+            self._checkpoint_steps = 0
+            self._checkpoint_time = now
+        self._checkpoint_countdown = self._next_checkpoint_countdown()
+
+    def write_state(self, path: str) -> None:
+        r"""Writes the state() to a file, atomically.
+
+        Args:
+            path: The file to (re)place.
+        """
+
+        self._write_state(path, self.state())
+
+    @staticmethod
+    def _write_state(path: str, state: bytes) -> None:
+        directory: str = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as stream:
+                stream.write(state)
+                stream.flush()
+                os.fsync(stream.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def map_shards(
+        self,
+        function: Callable[["GearIterator"], Any],
+        workers: Optional[int] = None,
+        shards: int = 0,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        r"""Runs function(shard) for every shard in a pool of processes.
+
+        Args:
+            function: Called with each shard, in a worker process, so it
+                must be picklable (e.g. a module-level function).
+            workers: Number of processes, default is the number of CPUs.
+            shards: Number of shards, default is the number of workers.
+            ordered: Return the results in the order of the shards, or
+                as soon as they are ready.
+
+        Returns:
+            The results, as they come.
+        """
+
+        workers = workers or os.cpu_count() or 1
+        parts: List[GearIterator] = self.shards(shards or workers)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            if ordered:
+                yield from executor.map(function, parts)
+            else:
+                futures = [executor.submit(function, part) for part in parts]
+                for future in as_completed(futures):
+                    yield future.result()
+
+    def _advance(self) -> None:
+        r"""Moves the gears by one step, when more than the first gear moves.
+
+        The step is added to (or subtracted from) the gears digit by digit,
+        with carry, so it costs the same whatever the step is.
+        """
+
+        if self._mixed is not None:
+            self._advance_mixed()
+            return
+
+        indexes: List[int] = self._indexes
+        buffer: List[str] = self._buffer
+        digits: str = self._digits
+        base: int = self._base
+        carry: int = 0
+        i: int = 0
+        for step_index in self._step_indexes:
+            if i == len(indexes):  # Add a new gear
+                indexes.append(0)
+                buffer.insert(0, digits[0])
+
+            index: int = indexes[i] + step_index + carry
+            if index >= base:  # The wheel made a full turn
+                index -= base
+                carry = 1
+            elif index < 0:
+                index += base
+                carry = -1
+            else:
+                carry = 0
+
+            indexes[i] = index
+            buffer[-1 - i] = digits[index]
+            i += 1
+
+        while carry:  # Same, for the gears the step does not reach
+            if i == len(indexes):
+                indexes.append(0)
+                buffer.insert(0, digits[0])
+
+            index = indexes[i] + carry
+            if index >= base:
+                index = 0
+            elif index < 0:
+                index = base - 1
+            else:
+                carry = 0
+
+            indexes[i] = index
+            buffer[-1 - i] = digits[index]
+            i += 1
+
+        # Counting down, the leading gears go back to zero
+        while len(indexes) > self._width and indexes[-1] == 0:
+            indexes.pop()
+            del buffer[0]
+
+    def _advance_mixed(self) -> None:
+        r"""Same as _advance(), each gear with its own digits. Never overflows."""
+
+        indexes: List[int] = self._indexes
+        buffer: List[str] = self._buffer
+        alphabets: List[str] = self._alphabets  # type: ignore
+        step_indexes: List[int] = self._step_indexes
+        carry: int = 0
+        for i, radix in enumerate(self._radices):
+            index: int = indexes[i] + carry
+            if i < len(step_indexes):
+                index += step_indexes[i]
+            elif not carry:
+                return
+            if index >= radix:
+                index -= radix
+                carry = 1
+            elif index < 0:
+                index += radix
+                carry = -1
+            else:
+                carry = 0
+
+            indexes[i] = index
+            buffer[-1 - i] = alphabets[i][index]
+
+    def next_batch(self, n: int) -> List[str]:
+        r"""Returns the next n values at once (fewer at the end).
+
+        Same as calling next() n times, without the per-call overhead.
+        """
+
+        count: Optional[int] = self._count()
+        if count is not None:
+            n = min(n, count - self.position)
+        if n <= 0:
+            return []
+
+        buffer: List[str] = self._buffer
+        result: List[str] = []
+        append = result.append
+        if not self._start_value_returned:
+            self._start_value_returned = True
+            append("".join(buffer))
+            n -= 1
+
+        indexes: List[int] = self._indexes
+        digits: str = self._digits
+        base: int = self._base
+        delta: int = self._delta
+        advance: Callable[[], None] = self._advance
+        for _ in range(n):
+            index: int = indexes[0] + delta
+            if 0 <= index < base:
+                indexes[0] = index
+                buffer[-1] = digits[index]
+            else:
+                advance()
+            append("".join(buffer))
+
+        self._value += n * delta
+
+        self._checkpoint_countdown -= n
+        if self._checkpoint_countdown <= 0:
+            self._checkpoint(len(result))
+
+        return result
+
+    def fill(self, buffer: Any, separator: bytes = b"\n") -> int:
+        r"""Writes the next values into a bytearray or a writable memoryview.
+
+        Each value is UTF-8 encoded and followed by the separator, e.g.
+        b"\n" or b"\0", or b"" for fixed-width values. Only whole values
+        are written. ValueError if not even the next value fits.
+
+        Returns:
+            How many values were written, zero when there are no more.
+        """
 
-                # Add a new gear
-                if i == len(self._gears) and i < self._max_length:
-                    self._gears.append(self._symbol_list.copy())
-                    self._gears[i].pop(0)  # Remove the "zero"
-                    spin_wheels = False
-
-                if i == self._max_length:
-                    raise StopIteration
-            else:  # Wheel not yet reached the final set value
-                spin_wheels = False
-            
-            if len(self._end_value) > 0 and repr(self) == self._end_value:
-                raise StopIteration
-
-        return repr(self)
+        view: memoryview = memoryview(buffer).cast("B")
+        if view.readonly:  # Else the values would be consumed, then lost
+            raise ValueError("fill() needs a writable buffer.")
+        size: int = len(view)
+        start: int = self.position
+        offset: int = 0
+        written: int = 0
+
+        while True:
+            # As many as fit, if they are as long as the current one. Values
+            # may get longer when counting up, or take more bytes than
+            # characters, then the ones which don't fit are given back.
+            record_size: int = len(self._buffer) + len(separator)
+            values: List[str] = self.next_batch(max((size - offset) // record_size, 1))
+            if not values:
+                return written
+
+            records: bytes = separator.join(map(str.encode, values)) + separator
+            end: int = offset + len(records)
+            if end <= size:
+                view[offset:end] = records
+                offset = end
+                written += len(values)
+                continue
+
+            for value in values:  # Not all of them fit, one by one then
+                record: bytes = value.encode() + separator
+                end = offset + len(record)
+                if end > size:  # Give back what was not written
+                    self.seek(start + written)
+                    if offset == 0:  # Else it would look exhausted
+                        raise ValueError(
+                            f"Buffer too small for a value of {len(record)} bytes."
+                        )
+                    return written
+                view[offset:end] = record
+                offset = end
+                written += 1
 
     def __enter__(self) -> object:
         r"""Context management protocol.
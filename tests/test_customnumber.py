@@ -1,3 +1,6 @@
+import pickle
+import tracemalloc
+
 import pytest
 from custom_numbers import custom_numbers as cn
 
@@ -344,3 +347,363 @@ class TestCustomNumber:
         assert str(num) == original
         assert str(result) == expected
 
+    def test_digit_to_int_invalid_digit(self):
+        sysN = cn.CustomNumeralSystem("paf")
+        num = cn.CustomNumber(sysN, "aaa")
+        with pytest.raises(ValueError):
+            result = num.digit_to_int("x")
+
+    def test_to_decimal_base62(self):
+        digits = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        expected = 62**5 - 1
+        sysN = cn.CustomNumeralSystem(digits)
+        num = cn.CustomNumber(sysN, "ZZZZZ")
+        result = num.to_decimal()
+        assert result == expected
+
+    def test_from_decimal_256_bit(self):
+        """No precision loss above 2**53."""
+
+        number = 2**256 - 2**200 + 12345
+        expected = format(number, "x")
+        sysN = cn.CustomNumeralSystem("0123456789abcdef")
+        num = cn.CustomNumber(sysN, "0")
+        num.from_decimal(number)
+        result = str(num)
+        assert result == expected
+
+    def test_from_decimal_negative_big(self):
+        number = -(2**128 + 1)
+        expected = "-" + format(-number, "b")
+        sysN = cn.CustomNumeralSystem("01")
+        num = cn.CustomNumber(sysN, "0")
+        num.from_decimal(number)
+        result = str(num)
+        assert result == expected
+
+    def test_from_decimal_round_trip(self):
+        sysN = cn.CustomNumeralSystem("kje5nCs21Q9vW0KMqc")
+        num = cn.CustomNumber(sysN, "k")
+        for number in (0, 1, 17, 18, 19, 18**20, 18**20 - 1, 3**200 + 7):
+            num.from_decimal(number)
+            assert cn.CustomNumber(sysN, str(num)).to_decimal() == number
+
+    def test_from_decimal_base1(self):
+        sysN = cn.CustomNumeralSystem("a")
+        num = cn.CustomNumber(sysN, "a")
+        with pytest.raises(ValueError):
+            num.from_decimal(1)
+
+    def test_huge_number_round_trip(self):
+        """Big enough to take the divide-and-conquer path."""
+
+        sysN = cn.CustomNumeralSystem("paf")
+        num = cn.CustomNumber(sysN, "p")
+        for number in (3**1000, 3**1000 - 1, 3**777 + 3**300 + 5, 7**3001):
+            num.from_decimal(number)
+            value = str(num)
+            assert value[0] != "p"  # No leading "zeroes"
+            assert cn.CustomNumber(sysN, value).to_decimal() == number
+
+    def test_huge_number_known_value(self):
+        number = 16**5000 + 255
+        expected = format(number, "x")
+        sysN = cn.CustomNumeralSystem("0123456789abcdef")
+        num = cn.CustomNumber(sysN, expected)
+        assert num.to_decimal() == number
+        num.from_decimal(number)
+        assert str(num) == expected
+
+    def test_result_init_value(self):
+        expected = "f"
+        sysN = cn.CustomNumeralSystem("paf")
+        result = cn.CustomNumber(sysN, "a") + cn.CustomNumber(sysN, "a")
+        assert result.init_value == expected
+
+    def test_from_decimal_keeps_init_value(self):
+        expected = "aa"
+        sysN = cn.CustomNumeralSystem("paf")
+        num = cn.CustomNumber(sysN, "aa")
+        num.from_decimal(7)
+        assert num.init_value == expected
+        assert str(num) == "fa"
+
+    def test_repr_keeps_leading_zeroes(self):
+        expected = "-ppa"
+        sysN = cn.CustomNumeralSystem("paf")
+        num = cn.CustomNumber(sysN, "-ppa")
+        assert str(num) == expected
+        assert num.to_decimal() == -1
+
+    def test_sorting(self):
+        expected = ["-f", "p", "a", "ap", "ff"]
+        sysN = cn.CustomNumeralSystem("paf")
+        nums = [cn.CustomNumber(sysN, x) for x in ("ff", "a", "-f", "ap", "p")]
+        result = [str(x) for x in sorted(nums)]
+        assert result == expected
+
+    def test_interned_numeral_system(self):
+        expected = "fp"  # 8 - 2
+        sysN = cn.CustomNumeralSystem.get("paf")
+        numN1 = cn.CustomNumber(sysN, "ff")
+        numN2 = cn.CustomNumber(cn.CustomNumeralSystem.get("paf"), "f")
+        result = numN1 - numN2
+        assert str(result) == expected
+
+    def test_no_instance_dict(self):
+        sysN = cn.CustomNumeralSystem("paf")
+        num = cn.CustomNumber(sysN, "a")
+        assert not hasattr(num, "__dict__")
+        assert not hasattr(sysN, "__dict__")
+
+    def test_memory_per_instance(self):
+        """Regression guard, see benchmarks/bench_memory.py"""
+
+        count = 10000
+        sysN = cn.CustomNumeralSystem("0123456789abcdef")
+        values = [format(i + 10**6, "x") for i in range(count)]
+        nums = [None] * count
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for i, value in enumerate(values):
+            nums[i] = cn.CustomNumber(sysN, value)
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert (after - before) / count < 120
+
+    def test_init_value_signed(self):
+        expected = "+a"
+        sysN = cn.CustomNumeralSystem("paf")
+        num = cn.CustomNumber(sysN, "+a")
+        num.from_decimal(2)
+        assert num.init_value == expected
+        assert str(num) == "f"
+
+    def test_pickle(self):
+        sysN = cn.CustomNumeralSystem("paf")
+        num = cn.CustomNumber(sysN, "-af")
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            result = pickle.loads(pickle.dumps(num, protocol))
+            assert str(result) == "-af"
+            assert result == num
+
+    def test_legacy_pickle(self):
+        """Pickled by v1.3.0: "-af", then from_decimal(-7)"""
+
+        serialized = (
+            b"\x80\x04\x95\xb6\x00\x00\x00\x00\x00\x00\x00\x8c\x1dcustom_numbers.custom_numbers"
+            b"\x94\x8c\x0cCustomNumber\x94\x93\x94)\x81\x94}\x94(\x8c\x0f_numeral_system\x94h"
+            b"\x00\x8c\x13CustomNumeralSystem\x94\x93\x94)\x81\x94}\x94(\x8c\x07_digits\x94\x8c"
+            b"\x03paf\x94\x8c\x05_base\x94K\x03ub\x8c\x0b_init_value\x94\x8c\x03-af\x94\x8c"
+            b"\x06_value\x94\x8c\x02fa\x94\x8c\x05_sign\x94\x8c\x01-\x94ub."
+        )
+        result = pickle.loads(serialized)
+        assert str(result) == "-fa"
+        assert result.to_decimal() == -7
+        assert result.init_value == "-af"
+
+    def test_bytes(self):
+        sysB = cn.CustomNumeralSystem(b"0123456789ABCDEF")
+        num1 = cn.CustomNumber(sysB, b"-FF")
+        num2 = cn.CustomNumber(sysB, memoryview(b"+100"))
+        num3 = cn.CustomNumber(sysB, bytearray(b"1"))
+        assert num1.to_decimal() == -255
+        assert num2.to_decimal() == 256
+        assert bytes(num1 + num2) == b"1"
+        assert bytes(num2 - num3) == b"FF"
+        assert str(num1) == "-FF"
+        assert num1 == cn.CustomNumber(sysB, "-FF")
+        for value in [b"", b"-", b"12X", b"1 2"]:
+            with pytest.raises(ValueError):
+                cn.CustomNumber(sysB, value)
+
+    def test_bytes_needs_bytes_mode(self):
+        sysN = cn.CustomNumeralSystem("paf")
+        with pytest.raises(ValueError):
+            cn.CustomNumber(sysN, b"af")
+        with pytest.raises(ValueError):
+            bytes(cn.CustomNumber(sysN, "af"))
+
+    def test_int_operands(self):
+        sysN = cn.CustomNumeralSystem("0123456789")
+        num = cn.CustomNumber(sysN, "17")
+        assert str(num + 3) == "20"
+        assert str(3 + num) == "20"
+        assert str(num - 20) == "-3"
+        assert str(20 - num) == "3"
+        assert str(num * 2) == "34"
+        assert str(2 * num) == "34"
+        assert str(num // 5) == "3"
+        assert str(100 // num) == "5"
+        assert str(num / 5) == "3"
+        assert str(num % 5) == "2"
+        assert str(100 % num) == "15"
+        assert str(num**2) == "289"
+        assert str(2**num) == "131072"
+        with pytest.raises(TypeError):
+            num + "1"
+        with pytest.raises(TypeError):
+            num + 1.5
+
+    def test_in_place(self):
+        sysN = cn.CustomNumeralSystem("paf")  # 0 1 2
+        num = cn.CustomNumber(sysN, "+f")
+        same = num
+        num += 1
+        assert num is same
+        assert str(num) == "ap"
+        num *= cn.CustomNumber(sysN, "f")
+        num -= 2
+        num //= 2
+        num %= 3
+        assert num.to_decimal() == ((3 * 2 - 2) // 2) % 3
+        assert num.init_value == "+f"
+
+    def test_neg_divmod_pow(self):
+        sysN = cn.CustomNumeralSystem("0123456789")
+        num = cn.CustomNumber(sysN, "-17")
+        assert str(-num) == "17"
+        assert str(num) == "-17"
+        quotient, remainder = divmod(num, 5)
+        assert (str(quotient), str(remainder)) == ("-4", "3")
+        quotient, remainder = divmod(100, -num)
+        assert (str(quotient), str(remainder)) == ("5", "15")
+        base = cn.CustomNumber(sysN, "7")
+        assert str(pow(base, 128, 13)) == str(pow(7, 128, 13))
+        modulus = cn.CustomNumber(sysN, "13")
+        exponent = cn.CustomNumber(sysN, "128")
+        assert str(pow(base, exponent, modulus)) == str(pow(7, 128, 13))
+        with pytest.raises(ValueError):
+            pow(base, 2, cn.CustomNumber(cn.CustomNumeralSystem("01"), "1"))
+
+    def test_not_integer_results(self):
+        sysN = cn.CustomNumeralSystem("0123456789")
+        num = cn.CustomNumber(sysN, "2")
+        with pytest.raises(ValueError):
+            num**-1
+        with pytest.raises(ValueError):
+            2 ** cn.CustomNumber(sysN, "-1")
+        with pytest.raises(ValueError):
+            num **= -1
+        with pytest.raises(ValueError):
+            num.from_decimal(2.5)
+        assert str(num) == "2"
+        assert str(pow(num, -1, 7)) == "4"  # The modular inverse is an int
+
+    def test_succ_pred(self):
+        sysN = cn.CustomNumeralSystem("paf")  # 0 1 2
+        num = cn.CustomNumber(sysN, "+ff")
+        assert num.succ() is num
+        assert str(num) == "app"
+        assert num.to_decimal() == 9
+        num.pred()
+        assert str(num) == "ff"
+        assert num.init_value == "+ff"
+        for _ in range(9):
+            num.pred()
+        assert str(num) == "-a"
+        num.succ()
+        assert str(num) == "p"
+        num.pred()
+        assert str(num) == "-a"
+
+    def test_increment(self):
+        sysN = cn.CustomNumeralSystem("0123456789")
+        num = cn.CustomNumber(sysN, "0099")
+        expected = 99
+        for k in [1, 900, -1000, 5, -3, 12345678, -12345600, -1, 0]:
+            num.increment(k)
+            expected += k
+            assert str(num) == str(expected)
+            assert num.to_decimal() == expected
+        num.from_decimal(7)
+        num.increment(3)
+        assert str(num) == "10"
+        assert pickle.loads(pickle.dumps(num)).succ().to_decimal() == 11
+
+    def test_increment_base1(self):
+        sysN = cn.CustomNumeralSystem("p")
+        num = cn.CustomNumber(sysN, "p")
+        with pytest.raises(ValueError):
+            num.succ()
+        assert str(num) == "p"
+
+    def test_digitwise_addition(self):
+        sysN = cn.CustomNumeralSystem("kje5nCs21Q9vW0KMqc")
+        length = cn.CustomNumber._DIGITWISE_THRESHOLD * 3
+        values = [
+            sysN.base**length - 1,
+            sysN.base ** (length - 1),
+            7**1500,
+            -(7**1500) + 5,
+            -(sysN.base**length),
+            3,
+            0,
+        ]
+        for x in values:
+            for y in values:
+                a = cn.CustomNumber._from_decimal(sysN, x)
+                b = cn.CustomNumber._from_decimal(sysN, y)
+                a = cn.CustomNumber(sysN, str(a))  # Long ones have no int yet
+                b = cn.CustomNumber(sysN, str(b))
+                assert str(a + b) == str(cn.CustomNumber._from_decimal(sysN, x + y))
+                assert str(a - b) == str(cn.CustomNumber._from_decimal(sysN, x - y))
+                assert (a - b).to_decimal() == x - y
+                a -= b
+                assert a.to_decimal() == x - y
+
+    def test_digitwise_keeps_digits(self):
+        sysN = cn.CustomNumeralSystem("0123456789")
+        long = "1" * (cn.CustomNumber._DIGITWISE_THRESHOLD + 1)
+        a = cn.CustomNumber(sysN, "+00" + long)
+        b = cn.CustomNumber(sysN, long)
+        total = a + b
+        assert total._int is None  # Not computed yet
+        assert str(total) == "2" * len(long)
+        assert str(total - a - b) == "0"
+        assert str(b - a - a) == "-" + long
+        assert total.to_decimal() == int("2" * len(long))
+        a += b
+        assert a.init_value == "+00" + long
+        assert str(pickle.loads(pickle.dumps(a))) == str(total)
+
+    def test_hash(self):
+        sysN = cn.CustomNumeralSystem("paf")
+        strings = ("a", "+a", "pa", "-a", "-pa", "f")
+        numbers = {cn.CustomNumber(sysN, x) for x in strings}
+        assert sorted(str(x) for x in numbers) == ["-a", "a", "f"]
+        counts = {cn.CustomNumber(sysN, "a"): 1}
+        counts[cn.CustomNumber(sysN, "-p") + cn.CustomNumber(sysN, "a")] += 1
+        assert counts == {cn.CustomNumber(sysN, "pa"): 2}
+        sysU = cn.CustomNumeralSystem("xyz")
+        mixed = {cn.CustomNumber(sysN, "a"): 1, cn.CustomNumber(sysU, "y"): 2}
+        assert mixed[cn.CustomNumber(sysN, "pa")] == 1
+        assert mixed[cn.CustomNumber(sysU, "y")] == 2
+        assert len({cn.CustomNumber(sysN, "f"), cn.CustomNumber(sysU, "z")}) == 2
+        assert cn.CustomNumber(sysN, "a") != 1
+        with pytest.raises(TypeError):
+            cn.CustomNumber(sysN, "a") < 1
+
+    def test_compare_digits(self):
+        sysN = cn.CustomNumeralSystem("kje5nCs21Q9vW0KMqc")
+        length = cn.CustomNumber._DIGITWISE_THRESHOLD + 10
+        values = [0, 1, -1, 17**length, 17**length + 1, -(17**length), 18**length - 1]
+        strings = [str(cn.CustomNumber._from_decimal(sysN, x)) for x in values]
+        strings += ["-k", "+kkk" + strings[3], "-kk" + strings[5][1:]]
+        values += [0, values[3], values[5]]
+        nums = [cn.CustomNumber(sysN, x) for x in strings]
+        for a, x in zip(nums, values):
+            for b, y in zip(nums, values):
+                assert (a < b, a <= b, a == b, a != b, a >= b, a > b) == (
+                    x < y, x <= y, x == y, x != y, x >= y, x > y
+                )
+        assert all(num._int is None for num in nums if len(str(num)) > length)
+        assert [x.to_decimal() for x in sorted(nums)] == sorted(values)
+
+    def test_sort_key(self):
+        sysN = cn.CustomNumeralSystem("paf")
+        nums = [cn.CustomNumber(sysN, x) for x in ("ff", "a", "-f", "ap", "p")]
+        result = [str(x) for x in sorted(nums, key=cn.CustomNumber.sort_key)]
+        assert result == ["-f", "p", "a", "ap", "ff"]
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from custom_numbers import custom_numbers as cn
 
@@ -73,3 +75,160 @@ class TestCustomNumeralSystem:
         result = sysN1 != sysN2
         assert result == expected
 
+    def test_number_validation_letter_s(self):
+        """The 's' and the backslash are regular digits, only whitespace is forbidden."""
+
+        expected = True
+        sysN = cn.CustomNumeralSystem("kje5nCs21Q9vW0KMqc\\")
+        result = sysN.valid_number("s\\k")
+        assert result == expected
+
+    def test_number_validation_whitespace(self):
+        expected = False
+        sysN = cn.CustomNumeralSystem("paf")
+        result = sysN.valid_number("p a")
+        assert result == expected
+
+    def test_number_validation_forbidden_digit(self):
+        expected = False
+        sysN = cn.CustomNumeralSystem("pa%")
+        result = sysN.valid_number("a%")
+        assert result == expected
+
+    def test_only_forbidden_digits(self):
+        sysN = cn.CustomNumeralSystem("- ")
+        assert not sysN.valid_number("-")
+        assert list(sysN.validate_many(["-", " "])) == [0, 0]
+
+    def test_hash(self):
+        assert hash(cn.CustomNumeralSystem("paf")) == hash(cn.CustomNumeralSystem(b"paf"))
+        assert len({cn.CustomNumeralSystem("paf"), cn.CustomNumeralSystem("paf")}) == 1
+
+    def test_get_interning(self):
+        sysN1 = cn.CustomNumeralSystem.get("paf")
+        sysN2 = cn.CustomNumeralSystem.get("paf")
+        sysN3 = cn.CustomNumeralSystem.get("paz")
+        assert sysN1 is sysN2
+        assert sysN1 is not sysN3
+        assert sysN1 == cn.CustomNumeralSystem("paf")
+
+    def test_get_invalid_digits(self):
+        with pytest.raises(ValueError):
+            sysN = cn.CustomNumeralSystem.get("abcc")
+
+    def test_encode_many(self):
+        expected = ["p", "a", "ap", "-aa", "pppf"]
+        sysN = cn.CustomNumeralSystem("paf")
+        result = sysN.encode_many([0, 1, 3, -4, 2])
+        assert result[:4] == expected[:4]
+        assert sysN.encode_many([2], width=4) == expected[4:]
+
+    def test_decode_many(self):
+        expected = [0, 1, 3, -4, 2]
+        sysN = cn.CustomNumeralSystem("paf")
+        result = sysN.decode_many(["p", "a", "+ap", "-aa", "pppf"])
+        assert result == expected
+
+    def test_decode_many_invalid(self):
+        sysN = cn.CustomNumeralSystem("paf")
+        with pytest.raises(ValueError):
+            result = sysN.decode_many(["p", "x"])
+
+    def test_encode_many_numpy(self):
+        np = pytest.importorskip("numpy")
+        sysN = cn.CustomNumeralSystem("0123456789abcdef")
+        numbers = np.array([0, 15, -255, 2**63 - 1, -(2**63)], dtype=np.int64)
+        expected = [format(x, "x") for x in numbers.tolist()]
+        result = sysN.encode_many(numbers)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == expected
+        result = sysN.encode_many(numbers, width=3)
+        assert result.tolist()[:3] == ["000", "00f", "-0ff"]
+
+    def test_decode_many_numpy(self):
+        np = pytest.importorskip("numpy")
+        sysN = cn.CustomNumeralSystem("paf")
+        values = np.array(["p", "a", "+ap", "-aa", "pppf"])
+        result = sysN.decode_many(values)
+        assert result.dtype == np.int64
+        assert result.tolist() == [0, 1, 3, -4, 2]
+        with pytest.raises(ValueError):
+            sysN.decode_many(np.array(["aa", "a-a"]))
+
+    def test_numpy_round_trip(self):
+        np = pytest.importorskip("numpy")
+        sysN = cn.CustomNumeralSystem("kje5nCs21Q9vW0KMqc")
+        numbers = np.random.default_rng(7).integers(-(2**63), 2**63 - 1, 1000)
+        encoded = sysN.encode_many(numbers)
+        assert encoded.tolist() == sysN.encode_many(numbers.tolist())
+        result = sysN.decode_many(encoded)
+        assert result.dtype == np.int64
+        assert (result == numbers).all()
+
+    def test_numpy_2d(self):
+        np = pytest.importorskip("numpy")
+        sysN = cn.CustomNumeralSystem("paf")
+        numbers = np.array([[0, 1, 2], [-3, 4, 5]])
+        encoded = sysN.encode_many(numbers)
+        assert encoded.shape == (2, 3)
+        assert encoded.tolist() == [["p", "a", "f"], ["-ap", "aa", "af"]]
+        assert sysN.encode_many(numbers.astype(object)).tolist() == encoded.tolist()
+        assert (sysN.decode_many(encoded) == numbers).all()
+        assert sysN.encode_many(np.array(7)).tolist() == "fa"
+
+    def test_decode_many_numpy_big(self):
+        """Would not fit in 64 bits, the exact integers are returned."""
+
+        np = pytest.importorskip("numpy")
+        sysN = cn.CustomNumeralSystem("01")
+        result = sysN.decode_many(np.array(["1" * 70]))
+        assert result.tolist() == [2**70 - 1]
+
+    def test_bytes_mode(self):
+        sysB = cn.CustomNumeralSystem(b"paf")
+        assert sysB.bytes_mode
+        assert not cn.CustomNumeralSystem("paf").bytes_mode
+        assert sysB == cn.CustomNumeralSystem("paf")
+        assert sysB.valid_number(b"afp")
+        assert sysB.valid_number(bytearray(b"afp"))
+        assert sysB.valid_number(memoryview(b"afp"))
+        assert sysB.valid_number("afp")
+        assert not sysB.valid_number(b"afx")
+        assert not sysB.valid_number(memoryview(b"a f"))
+        with pytest.raises(ValueError):
+            cn.CustomNumeralSystem("paf").valid_number(b"af")
+        assert pickle.loads(pickle.dumps(sysB)).bytes_mode
+
+    def test_bytes_mode_conversion(self):
+        for digits in [b"01", b"0123456789ABCDEF", bytes(range(256)), b"kje5nCs21Q9vW0KMqc"]:
+            sysB = cn.CustomNumeralSystem(digits)
+            for number in [0, 1, 255, 2**64 + 3, 7**500]:
+                value = sysB._from_int_bytes(number)
+                assert value == sysB._from_int(number).encode("latin-1")
+                assert sysB._to_int_bytes(value) == number
+                assert sysB._to_int_bytes(memoryview(value)) == number
+
+    def test_validate_many(self):
+        sysN = cn.CustomNumeralSystem("paf")
+        values = ["paf", "pxf", "", "a f", "-af", "+", "ffffffx"]
+        assert list(sysN.validate_many(values)) == [-1, 1, 0, 1, 0, 0, 6]
+        assert list(sysN.validate_many(values, signed=True)) == [-1, 1, 0, 1, -1, 1, 6]
+        assert list(sysN.validate_many(iter(["af", "a-"]), signed=True)) == [-1, 1]
+        assert list(sysN.validate_many([])) == []
+        sysG = cn.CustomNumeralSystem("αβγ")  # Not latin-1
+        result = sysG.validate_many(["αβγ", "αb", "", "-γ"], signed=True)
+        assert list(result) == [-1, 1, 0, -1]
+        many = ["paf"] * 1000 + ["pa*"]
+        result = sysN.validate_many(many)
+        assert result[-1] == 2 and max(result[:-1]) == -1
+        for value, offset in zip(values, sysN.validate_many(values)):
+            if value:
+                assert (offset < 0) == sysN.valid_number(value)
+
+    def test_validate_many_bytes(self):
+        sysB = cn.CustomNumeralSystem(b"paf")
+        values = [b"paf", bytearray(b"pxf"), memoryview(b"a f"), b""]
+        assert list(sysB.validate_many(values)) == [-1, 1, 1, 0]
+        assert list(sysB.validate_many(["paf", "p%"])) == [-1, 1]
+        with pytest.raises(ValueError):
+            cn.CustomNumeralSystem("paf").validate_many([b"paf"])
@@ -0,0 +1,83 @@
+import pickle
+
+import pytest
+from custom_numbers import custom_numbers as cn
+
+sysN = cn.CustomNumeralSystem("paf")
+sys10 = cn.CustomNumeralSystem("0123456789")
+
+
+class TestCustomRange:
+    r"""CustomRange test class."""
+
+    def test_values(self):
+        assert list(cn.CustomRange(sysN, "a", "aa")) == ["a", "f", "ap"]
+        assert list(cn.CustomRange(sysN, "aa")) == ["p", "a", "f", "ap"]
+        assert list(cn.CustomRange(sysN, -3, 3, 2)) == ["-ap", "-a", "a"]
+        assert list(cn.CustomRange(sysN, "+a", "-a", -1)) == ["a", "p"]
+        start = cn.CustomNumber(sysN, "ap")
+        assert list(cn.CustomRange(sysN, start, 5)) == ["ap", "aa"]
+
+    def test_same_as_range(self):
+        for args in [(0, 100), (7, 93, 5), (93, 7, -5), (-20, 20, 3), (5, 5)]:
+            custom = cn.CustomRange(sys10, *args)
+            expected = [str(x) for x in range(*args)]
+            assert len(custom) == len(expected)
+            assert list(custom) == expected
+            assert list(reversed(custom)) == expected[::-1]
+            assert [custom[i] for i in range(-len(custom), len(custom))] == expected * 2
+            for part in [slice(None, None, 2), slice(3, -2), slice(None, None, -3)]:
+                assert list(custom[part]) == expected[part]
+
+    def test_lazy(self):
+        huge = cn.CustomRange(sysN, "a" + "p" * 1000)
+        with pytest.raises(OverflowError):  # As with range()
+            len(huge)
+        assert huge[-1] == "f" * 1000
+        assert ("f" * 1000) in huge
+        assert huge.index("a" + "p" * 999) == 3**999
+        assert huge[::2][-1] == "f" * 1000
+        assert huge[::-1][0] == "f" * 1000
+
+    def test_contains(self):
+        custom = cn.CustomRange(sysN, "a", "aap", 2)
+        assert "ap" in custom
+        assert "pap" in custom  # Leading zeroes don't change the value
+        assert cn.CustomNumber(sysN, "af") in custom
+        assert 5 in custom
+        assert "aa" not in custom
+        assert "-a" not in custom
+        assert "x" not in custom
+        assert "" not in custom
+        assert 1.5 not in custom
+        assert custom.count("af") == 1
+        assert custom.index("af") == 2
+        with pytest.raises(ValueError):
+            custom.index("aa")
+        assert cn.CustomNumber(sys10, "1") not in custom
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            cn.CustomRange(sysN, "x")
+        with pytest.raises(ValueError):
+            cn.CustomRange(sysN, "a", "f", 0)
+        with pytest.raises(TypeError):
+            cn.CustomRange(sysN, 1.5)
+        with pytest.raises(ValueError):
+            cn.CustomRange(cn.CustomNumeralSystem("z"), 2)
+        assert list(cn.CustomRange(cn.CustomNumeralSystem("z"), 1)) == ["z"]
+
+    def test_properties(self):
+        custom = cn.CustomRange(sysN, "-a", "ap", 2)
+        assert (custom.start, custom.stop, custom.step) == ("-a", "ap", 2)
+        assert custom.numeral_system is sysN
+        assert repr(custom) == "CustomRange('paf', '-a', 'ap', 2)"
+        assert not cn.CustomRange(sysN, "a", "a")
+        assert custom == cn.CustomRange(sysN, -1, 3, 2)
+        assert hash(custom) == hash(cn.CustomRange(sysN, -1, 3, 2))
+        assert custom != cn.CustomRange(sysN, -1, 3)
+
+    def test_pickle(self):
+        custom = cn.CustomRange(sysN, "-a", "apf", 2)[1:]
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(custom, protocol)) == custom
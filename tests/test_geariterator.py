@@ -1,5 +1,7 @@
+import copy
 import pickle
 import sys
+from itertools import islice, product
 
 import pytest
 from custom_numbers import custom_numbers as cn
@@ -39,6 +41,11 @@ expected2 = [
 ]
 
 
+def shard_values(shard):
+    """Module-level, so it can be pickled for the worker processes."""
+    return list(shard)
+
+
 class TestGearIterator:
     r"""GearIterator test class."""
 
@@ -101,6 +108,39 @@ class TestGearIterator:
         result = it.combinations
         assert result == expected
 
+    def test_combinations_exact(self):
+        sys3 = cn.CustomNumeralSystem("pba")
+        for args in ([sys3, 0, 2], [sys3, 2, 3, "ap"], [sys3, 4, 6], [sys3, 0, 0, "ba", "bbbb"]):
+            expected = len(list(cn.GearIterator(*args)))
+            result = cn.GearIterator(*args).combinations
+            assert result == expected
+
+    def test_combinations_same_start_and_end(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 0, 0, "3", "3")
+        assert it.combinations == 1
+
+    def test_combinations_unlimited(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10)
+        with pytest.raises(ValueError):
+            it.combinations
+        with pytest.raises(TypeError):
+            len(it)
+        assert it
+
+    def test_remaining(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 3, 3)
+        assert len(it) == 1000
+        next(it)
+        assert it.remaining() == 999
+        it.seek(990)
+        assert len(it) == 10
+        assert len(list(it)) == 10
+        assert len(it) == 0
+        assert it.combinations == 1000
+
     def test_bug03(self):
         """2024-03-28 Most basic test."""
 
@@ -127,6 +167,374 @@ class TestGearIterator:
         expected = ["3"]
         assert result == expected
 
+    def test_legacy_pickle(self):
+        """Iterator pickled by v1.3.0 after returning "ap", "ab", "aa", "bpp"."""
+
+        serialized = (
+            b"\x80\x04\x95J\x01\x00\x00\x00\x00\x00\x00\x8c\x1dcustom_numbers.custom_numbers"
+            b"\x94\x8c\x0cGearIterator\x94\x93\x94)\x81\x94}\x94(\x8c\x0f_numeral_system"
+            b"\x94h\x00\x8c\x13CustomNumeralSystem\x94\x93\x94)\x81\x94}\x94(\x8c\x07_digits"
+            b"\x94\x8c\x03pba\x94\x8c\x05_base\x94K\x03ub\x8c\x0c_symbol_list\x94]\x94(\x8c"
+            b"\x01p\x94\x8c\x01b\x94\x8c\x01a\x94e\x8c\x0b_min_length\x94K\x02\x8c\x0b"
+            b"_max_length\x94K\x03\x8c\x0c_start_value\x94\x8c\x02pa\x94\x8c\x15"
+            b"_start_value_returned\x94\x88\x8c\x06_index\x94K\x00\x8c\r_combinations\x94K"
+            b"\x00\x8c\n_end_value\x94\x8c\x00\x94\x8c\x06_gears\x94]\x94(]\x94(h\x0fh\x10h"
+            b"\x11e]\x94(h\x0fh\x10h\x11e]\x94(h\x10h\x11eeub."
+        )
+        our_iterator = pickle.loads(serialized)
+        assert list(our_iterator) == ["bpb", "bpa", "bbp", "bbb", "bba"] + [
+            "bap", "bab", "baa", "app", "apb", "apa", "abp", "abb", "aba",
+            "aap", "aab", "aaa",
+        ]
+
+    def test_end_value_with_padding(self):
+        """The end_value is compared as a number, not as a string."""
+
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 2, 0, "", "3")
+        result = list(it)
+        expected = ["00", "01", "02"]
+        assert result == expected
+
+    def test_max_length_stays_stopped(self):
+        sys2 = cn.CustomNumeralSystem("01")
+        it = cn.GearIterator(sys2, 0, 2)
+        assert list(it) == ["0", "1", "10", "11"]
+        with pytest.raises(StopIteration):
+            next(it)
+        assert str(it) == "11"
+
+    def test_getitem(self):
+        it = cn.GearIterator(*params1)
+        expected = list(cn.GearIterator(*params1))
+        result = [it[i] for i in range(len(expected))]
+        assert result == expected
+        assert it[-1] == "aa"
+        assert next(it) == "p"  # Not moved
+        with pytest.raises(IndexError):
+            it[len(expected)]
+
+    def test_getitem_start_value(self):
+        it = cn.GearIterator(*params2)
+        assert it[0] == "ap"
+        assert it[3] == "bpp"
+        assert it[-1] == "aaa"
+
+    def test_seek(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 3, 0, "005")
+        it.seek(1000)
+        assert it.position == 1000
+        assert next(it) == "1005"
+        assert next(it) == "1006"
+        assert it.position == 1002
+        it.seek(0)
+        assert next(it) == "005"
+
+    def test_seek_end(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 0, 0, "", "20")
+        it.seek(20)
+        with pytest.raises(StopIteration):
+            next(it)
+        it.seek(19)
+        assert list(it) == ["19"]
+        with pytest.raises(IndexError):
+            it.seek(21)
+
+    def test_skip(self):
+        it = cn.GearIterator(*params1)
+        assert next(it) == "p"
+        it.skip(3)
+        assert it.position == 4
+        assert next(it) == "bb"
+        it.skip(-2)
+        assert next(it) == "bp"
+
+    def test_position(self):
+        it = cn.GearIterator(*params2)
+        assert it.position == 0
+        list(it)
+        assert it.position == 27 - 6  # "ap" is 6, stop is 3**3
+
+    def test_next_batch(self):
+        it = cn.GearIterator(*params1)
+        expected = list(cn.GearIterator(*params1))
+        result = it.next_batch(4) + it.next_batch(4) + it.next_batch(4)
+        assert result == expected
+        assert it.next_batch(4) == []
+
+    def test_next_batch_unlimited(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10)
+        assert next(it) == "0"
+        result = it.next_batch(1000)
+        assert result == [str(i) for i in range(1, 1001)]
+        assert next(it) == "1001"
+
+    def test_fill(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 3, 3)
+        buffer = bytearray(10)
+        result = it.fill(buffer)
+        assert result == 2
+        assert buffer[:8] == b"000\n001\n"
+        assert next(it) == "002"
+
+    def test_fill_too_small(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 3, 3, "998")
+        with pytest.raises(ValueError):
+            it.fill(bytearray(3))
+        assert it.position == 0
+        assert it.fill(bytearray(4)) == 1
+        assert it.fill(bytearray(4)) == 1
+        assert it.fill(bytearray(4)) == 0  # Exhausted
+        assert it.fill(bytearray(0)) == 0
+
+    def test_fill_read_only(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 3, 3)
+        with pytest.raises(ValueError):
+            it.fill(bytes(100))
+        with pytest.raises(ValueError):
+            it.fill(memoryview(bytearray(100)).toreadonly())
+        assert it.position == 0
+
+    def test_fill_fixed_width_memoryview(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 2, 2, "95")
+        buffer = bytearray(1000)
+        result = it.fill(memoryview(buffer)[100:], b"")
+        assert result == 5
+        assert buffer[100:110] == b"9596979899"
+
+    def test_fill_nul_separated(self):
+        sys3 = cn.CustomNumeralSystem("pba")
+        it = cn.GearIterator(sys3)
+        buffer = bytearray(4096)
+        result = it.fill(buffer, b"\0")
+        values = bytes(buffer).split(b"\0")[:result]
+        assert [x.decode() for x in values] == list(islice(cn.GearIterator(sys3), result))
+        assert it.position == result
+
+    def test_shards(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 2, 0, "07", "93")
+        expected = list(cn.GearIterator(sys10, 2, 0, "07", "93"))
+        shards = it.shards(4)
+        sizes = [len(list(pickle.loads(pickle.dumps(x)))) for x in shards]
+        assert sizes == [22, 22, 21, 21]
+        result = [value for shard in it.shards(4) for value in shard]
+        assert result == expected
+
+    def test_shards_remaining(self):
+        it = cn.GearIterator(*params1)
+        next(it)
+        next(it)
+        shards = it.shards(100)
+        assert len(shards) == 7
+        assert [list(x) for x in shards] == [[x] for x in expected1[2:]]
+
+    def test_shards_exhausted(self):
+        it = cn.GearIterator(*params1)
+        list(it)
+        assert it.shards(3) == []
+        assert list(it.map_shards(shard_values, workers=2)) == []
+
+    def test_shards_unlimited(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        with pytest.raises(ValueError):
+            cn.GearIterator(sys10).shards(2)
+
+    def test_map_shards(self):
+        sys3 = cn.CustomNumeralSystem("pba")
+        it = cn.GearIterator(sys3, 0, 5)
+        expected = list(cn.GearIterator(sys3, 0, 5))
+        result = list(it.map_shards(shard_values, workers=2, shards=5))
+        assert [value for part in result for value in part] == expected
+        result = list(it.map_shards(shard_values, workers=2, ordered=False))
+        assert sorted(value for part in result for value in part) == sorted(expected)
+
+    def test_state(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 2, 0, "07", "93")
+        expected = list(cn.GearIterator(sys10, 2, 0, "07", "93"))
+        list(islice(it, 10))
+        resumed = cn.GearIterator.from_state(it.state())
+        assert resumed.position == 10
+        assert list(resumed) == expected[10:]
+        resumed = cn.GearIterator.from_state(cn.GearIterator(*params1).state())
+        assert list(resumed) == expected1
+        unlimited = cn.GearIterator(sys3)
+        list(islice(unlimited, 100))
+        resumed = cn.GearIterator.from_state(unlimited.state())
+        assert list(islice(resumed, 5)) == list(islice(unlimited, 5))
+        with pytest.raises(ValueError):
+            cn.GearIterator.from_state(b'[0,"pba",0,2,0,9,0]')
+
+    def test_state_shard(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        shard = cn.GearIterator(sys10, 2, 2).shards(3)[1]
+        next(shard)
+        resumed = cn.GearIterator.from_state(shard.state())
+        assert list(resumed) == list(shard)
+
+    def test_checkpoint(self, tmp_path):
+        path = str(tmp_path / "gears.json")
+        it = cn.GearIterator(sys3, 0, 5)
+        expected = list(cn.GearIterator(sys3, 0, 5))
+        it.checkpoint(path, every=10)
+        values = list(islice(it, 25))  # 24 steps after the first value
+        # Written by the 21st value, which is returned again
+        assert cn.GearIterator.resume(path).position == 20
+        assert next(cn.GearIterator.resume(path)) == values[20]
+        batch = it.next_batch(10)
+        assert cn.GearIterator.resume(path).position == 25
+        assert list(cn.GearIterator.resume(path)) == expected[25:]
+        assert cn.GearIterator.resume(path).next_batch(10) == batch
+        assert [x.name for x in tmp_path.iterdir()] == ["gears.json"]
+        it.checkpoint(None)
+        list(it)
+        assert cn.GearIterator.resume(path).position == 25
+        with pytest.raises(ValueError):
+            it.checkpoint(path)
+
+    def test_checkpoint_every_value(self, tmp_path):
+        path = str(tmp_path / "gears.json")
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 0, 5)
+        it.checkpoint(path, every=10)
+        for _ in range(11):
+            value = next(it)
+        assert value == "10"
+        assert next(cn.GearIterator.resume(path)) == "10"
+        it = cn.GearIterator(sys10, 0, 5)
+        it.checkpoint(path, every=10)
+        batch = it.next_batch(5000)
+        assert batch[0] == "0"
+        assert cn.GearIterator.resume(path).next_batch(5000) == batch
+
+    def test_checkpoint_not_copied(self, tmp_path):
+        path = tmp_path / "gears.json"
+        it = cn.GearIterator(sys3, 0, 5)
+        it.checkpoint(str(path), every=1)
+        for other in [copy.copy(it), pickle.loads(pickle.dumps(it))]:
+            list(other)
+            assert not path.exists()
+        next(it)
+        next(it)
+        assert path.exists()
+
+    def test_state_bytes_mode(self):
+        sysB = cn.CustomNumeralSystem(bytes(range(256)))
+        it = cn.GearIterator(sysB, 0, 2)
+        next(it)
+        resumed = cn.GearIterator.from_state(it.state())
+        assert resumed._numeral_system.bytes_mode
+        assert list(resumed) == list(it)
+
+    def test_checkpoint_interval(self, tmp_path):
+        path = tmp_path / "gears.json"
+        it = cn.GearIterator(sys3)
+        it.checkpoint(str(path), interval=1e-9)
+        list(islice(it, it._CHECKPOINT_POLL))
+        assert not path.exists()
+        value = next(it)
+        assert cn.GearIterator.resume(str(path)).position == it.position - 1
+        assert next(cn.GearIterator.resume(str(path))) == value
+
+    def test_step(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        for args in [(sys3, 0, 4), (sys3, 3, 0, "", "bbap"), (sys10, 2, 0, "07", "93")]:
+            full = list(cn.GearIterator(*args))
+            for step in [1, 2, 3, 7, 10, 26, 100, 1000]:
+                assert list(cn.GearIterator(*args, step=step)) == full[::step]
+                reverse = cn.GearIterator(*args, step=step, reverse=True)
+                assert list(reverse) == full[::step][::-1]
+
+    def test_step_unlimited(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        it = cn.GearIterator(sys10, 0, 0, "5", step=999)
+        assert list(islice(it, 4)) == ["5", "1004", "2003", "3002"]
+        with pytest.raises(ValueError):
+            cn.GearIterator(sys10, reverse=True)
+        with pytest.raises(ValueError):
+            cn.GearIterator(sys10, 0, 3, step=0)
+
+    def test_step_random_access(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        expected = [str(x) for x in range(1000)][::7][::-1]
+        it = cn.GearIterator(sys10, 0, 3, step=7, reverse=True)
+        assert len(it) == it.combinations == len(expected)
+        assert [it[i] for i in range(len(expected))] == expected
+        assert it[-1] == expected[-1]
+        it.seek(100)
+        assert next(it) == expected[100]
+        assert it.remaining() == len(expected) - 101
+        assert it.next_batch(5) == expected[101:106]
+        assert [value for shard in it.shards(3) for value in shard] == expected[106:]
+        resumed = cn.GearIterator.from_state(it.state())
+        assert list(resumed) == list(it) == expected[106:]
+
+    def test_step_fill(self):
+        sys10 = cn.CustomNumeralSystem("0123456789")
+        expected = [str(x) for x in range(12345)][::3][::-1]
+        it = cn.GearIterator(sys10, 0, 0, "", "12345", step=3, reverse=True)
+        buffer = bytearray(1000)
+        result = []
+        while True:
+            written = it.fill(buffer)
+            if not written:
+                break
+            result += bytes(buffer).decode().split("\n")[:written]
+        assert result == expected
+
+    def test_state_version1(self):
+        it = cn.GearIterator.from_state(b'[1,"pba",0,2,0,9,3]')
+        assert list(it) == expected1[3:]
+
+    def test_pattern(self):
+        sys16 = cn.CustomNumeralSystem("0123456789abcdef")
+        it = cn.GearIterator(sys16, pattern="ab?[0-3]?")
+        expected = ["".join(x) for x in product("a", "b", str(sys16), "0123", str(sys16))]
+        assert it.combinations == len(expected) == 1024
+        assert list(it) == expected
+        sys18 = cn.CustomNumeralSystem("0123456789abcdef?]")
+        it = cn.GearIterator(sys18, pattern="[fa-c1]\\?[]0]")
+        assert list(it) == ["".join(x) for x in product("1abcf", "?", "0]")]
+
+    def test_pattern_positioning(self):
+        sys16 = cn.CustomNumeralSystem("0123456789abcdef")
+        expected = ["".join(x) for x in product("0123", "f", "ace", str(sys16))]
+        for step in [1, 5, 16, 17, 79, 1000]:
+            for reverse in [False, True]:
+                values = expected[::step][:: -1 if reverse else 1]
+                it = cn.GearIterator(
+                    sys16, pattern="[0-3]f[eca]?", step=step, reverse=reverse
+                )
+                assert len(it) == len(values)
+                assert [it[i] for i in range(len(values))] == values
+                it.seek(len(values) // 2)
+                assert next(it) == values[len(values) // 2]
+                assert it.next_batch(3) == values[len(values) // 2 + 1 :][:3]
+                rest = values[len(values) // 2 + 4 :]
+                assert [x for shard in it.shards(3) for x in shard] == rest
+                assert list(cn.GearIterator.from_state(it.state())) == rest
+                assert list(pickle.loads(pickle.dumps(it))) == rest
+
+    def test_pattern_invalid(self):
+        with pytest.raises(ValueError):
+            cn.GearIterator(sys3, pattern="")
+        with pytest.raises(ValueError):
+            cn.GearIterator(sys3, pattern="p?x")
+        with pytest.raises(ValueError):
+            cn.GearIterator(sys3, pattern="p[ab")
+        with pytest.raises(ValueError):
+            cn.GearIterator(sys3, pattern="p[a-p]")  # "a" is after "p"
+        with pytest.raises(ValueError):
+            cn.GearIterator(sys3, 2, pattern="p?")
+
     @classmethod
     def teardown_class(cls):
         del cls.scenario1
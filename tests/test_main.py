@@ -0,0 +1,57 @@
+import io
+import sys
+
+import pytest
+from custom_numbers import __main__ as cli
+
+
+def run(capsys, argv, stdin=""):
+    sys.stdin = io.StringIO(stdin)
+    try:
+        code = cli.main(argv)
+    finally:
+        sys.stdin = sys.__stdin__
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+class TestMain:
+    r"""python -m custom_numbers test class."""
+
+    def test_stdin(self, capsys):
+        code, out, _ = run(capsys, ["--dst", "paf"], "0\n5\n\n-3\n")
+        assert code == 0
+        assert out == "p\naf\n\n-ap\n"
+        code, out, _ = run(capsys, ["--src", "paf"], "af\r\n-ap")
+        assert out == "5\n-3\n"
+        code, out, _ = run(capsys, ["--dst", "paf"], "-0\n-00\n")
+        assert out == "p\np\n"
+
+    def test_files(self, capsys, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "CHUNK_SIZE", 100)  # Many chunks
+        path1 = tmp_path / "1.txt"
+        path1.write_text("".join(f"{x}\n" for x in range(1000)))
+        path2 = tmp_path / "2.txt"
+        path2.write_text("65535\n")
+        argv = ["--dst", "0123456789abcdef", str(path1), str(path2)]
+        expected = "".join(f"{x:x}\n" for x in range(1000)) + "ffff\n"
+        for workers in ["1", "3"]:
+            code, out, _ = run(capsys, argv + ["--workers", workers])
+            assert code == 0
+            assert out == expected
+
+    def test_invalid_number(self, capsys, tmp_path):
+        path = tmp_path / "numbers.txt"
+        path.write_text("1\n2\nx\n")
+        code, _, err = run(capsys, [str(path)])
+        assert code == 1
+        assert f"{path}:3: Invalid number 'x'" in err
+        code, _, err = run(capsys, ["--workers", "2"], "1\n\n--1\n")
+        assert code == 1
+        assert "<stdin>:3: Invalid number '--1'" in err
+
+    def test_invalid_arguments(self, capsys):
+        with pytest.raises(SystemExit):
+            run(capsys, ["--src", "aa"])
+        code, _, err = run(capsys, ["/nonexistent/file"])
+        assert code == 1
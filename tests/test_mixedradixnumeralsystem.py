@@ -0,0 +1,108 @@
+import pickle
+from itertools import product
+
+import pytest
+from custom_numbers import custom_numbers as cn
+
+plates = cn.MixedRadixNumeralSystem(["ABC", "ABC", "0123456789"])
+all_plates = ["".join(x) for x in product("ABC", "ABC", "0123456789")]
+
+
+class TestMixedRadixNumeralSystem:
+    r"""MixedRadixNumeralSystem test class."""
+
+    def test_properties(self):
+        assert plates.radices == (3, 3, 10)
+        assert plates.place_values == (30, 10, 1)
+        assert plates.capacity == 90
+        assert len(plates) == 3
+        assert plates.alphabets == ("ABC", "ABC", "0123456789")
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            cn.MixedRadixNumeralSystem([])
+        with pytest.raises(ValueError):
+            cn.MixedRadixNumeralSystem(["ab", ""])
+        with pytest.raises(ValueError):
+            cn.MixedRadixNumeralSystem(["ab", "cdc"])
+        with pytest.raises(ValueError):
+            cn.MixedRadixNumeralSystem(["ab", "c-"])
+        with pytest.raises(ValueError):
+            cn.MixedRadixNumeralSystem(["ab", "- "])
+
+    def test_conversion(self):
+        for number, value in enumerate(all_plates):
+            assert plates._to_int(value) == number
+            assert plates._from_int(number) == value
+        with pytest.raises(ValueError):
+            plates._from_int(90)
+
+    def test_valid_number(self):
+        assert plates.valid_number("CB3")
+        assert not plates.valid_number("3BC")
+        assert not plates.valid_number("CB")
+        assert not plates.valid_number("CB33")
+        with pytest.raises(ValueError):
+            plates.valid_number("")
+
+    def test_equality(self):
+        assert plates == cn.MixedRadixNumeralSystem(("ABC", "ABC", "0123456789"))
+        assert plates != cn.MixedRadixNumeralSystem(["ABC", "0123456789"])
+        assert plates != cn.CustomNumeralSystem("ABC")
+        assert hash(plates) == hash(cn.MixedRadixNumeralSystem(plates.alphabets))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(plates, protocol)) == plates
+
+    def test_custom_number(self):
+        num1 = cn.CustomNumber(plates, "AB7")
+        num2 = cn.CustomNumber(plates, "BA5")
+        assert num1.to_decimal() == 17
+        assert str(num1 + num2) == "BC2"
+        assert str(num1 - num2) == "-AB8"
+        assert num1 < num2
+        with pytest.raises(ValueError):
+            cn.CustomNumber(plates, "AB")
+        with pytest.raises(ValueError):
+            num1.from_decimal(90)
+        num1.from_decimal(89)
+        assert str(num1) == "CC9"
+        with pytest.raises(ValueError):
+            num1 + 1
+        with pytest.raises(ValueError):
+            num1 += 1
+        with pytest.raises(ValueError):
+            num1.succ()
+        assert str(num1) == "CC9"
+        assert str(-num1) == "-CC9"
+        with pytest.raises(ValueError):
+            num1.digit_to_int("A")
+        with pytest.raises(ValueError):
+            num1.int_to_digit(0)
+
+    def test_custom_range(self):
+        assert list(cn.CustomRange(plates, "AC8", "BA2")) == ["AC8", "AC9", "BA0", "BA1"]
+        assert "CC9" in cn.CustomRange(plates, 90)
+        with pytest.raises(ValueError):
+            cn.CustomRange(plates, 91)
+        plates_range = cn.CustomRange(plates, "AA3", "AB2")
+        assert repr(plates_range) == (
+            "CustomRange(MixedRadixNumeralSystem(['ABC', 'ABC', '0123456789']),"
+            " 'AA3', 'AB2')"
+        )
+        assert hash(plates_range) == hash(cn.CustomRange(plates, 3, 12))
+        assert "'-AA3', 'AA3'" in repr(cn.CustomRange(plates, -3, 3))
+
+    def test_gear_iterator(self):
+        assert list(cn.GearIterator(plates)) == all_plates
+        it = cn.GearIterator(plates, step=7, reverse=True)
+        expected = all_plates[::7][::-1]
+        assert len(it) == len(expected)
+        assert it[5] == expected[5]
+        assert next(it) == expected[0]
+        assert [x for shard in it.shards(4) for x in shard] == expected[1:]
+        assert list(cn.GearIterator.from_state(it.state())) == expected[1:]
+        assert list(pickle.loads(pickle.dumps(it))) == expected[1:]
+        with pytest.raises(ValueError):
+            cn.GearIterator(plates, 2)
+        with pytest.raises(ValueError):
+            cn.GearIterator(plates, pattern="A??")
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+from custom_numbers import custom_numbers as cn
+
+sys2 = cn.CustomNumeralSystem("01")
+sys4 = cn.CustomNumeralSystem("abcd")
+sys10 = cn.CustomNumeralSystem("0123456789")
+sys16 = cn.CustomNumeralSystem("0123456789abcdef")
+sys64 = cn.CustomNumeralSystem(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_."
+)
+plates = cn.MixedRadixNumeralSystem(["ABC", "ABC", "0123456789"])
+
+
+class TestTranscode:
+    r"""transcode() and transcode_many() test class."""
+
+    def test_transcode(self):
+        assert cn.transcode("11111111", sys2, sys16) == "ff"
+        assert cn.transcode("-ff", sys16, sys2) == "-11111111"
+        assert cn.transcode("+ff", sys16, sys2) == "11111111"
+        assert cn.transcode("0001", sys2, sys16) == "1"
+        assert cn.transcode("000", sys16, sys2) == "0"
+        assert cn.transcode("ba", sys4, sys2) == "100"
+        assert cn.transcode("255", sys10, sys16) == "ff"
+
+    def test_negative_zero(self):
+        assert cn.transcode("-0", sys10, sys4) == "a"
+        assert cn.transcode("-00", sys10, sys10) == "0"
+        assert cn.transcode("-0000", sys2, sys16) == "0"
+        assert cn.transcode("-0", sys10, plates) == "AA0"
+        assert cn.transcode("-AA0", plates, sys10) == "0"
+        assert cn.transcode("-AA1", plates, sys10) == "-1"
+
+    def test_same_as_trough_int(self):
+        random.seed(42)
+        systems = [sys2, sys4, sys10, sys16, sys64]
+        for src in systems:
+            for dst in systems:
+                for number in [0, 1, 63, 64, 4095, 4096, random.getrandbits(5000)]:
+                    value = src._from_int(number)
+                    assert cn.transcode(value, src, dst) == dst._from_int(number)
+
+    def test_mixed_radix(self):
+        assert cn.transcode("AB7", plates, sys10) == "17"
+        assert cn.transcode("17", sys10, plates) == "AB7"
+        with pytest.raises(ValueError):
+            cn.transcode("90", sys10, plates)
+
+    def test_transcode_many(self):
+        values = ["1", "-10", "11111111", "0"]
+        assert list(cn.transcode_many(values, sys2, sys16)) == ["1", "-2", "ff", "0"]
+        assert list(cn.transcode_many(iter(values), sys2, sys10)) == ["1", "-2", "255", "0"]
+
+    def test_invalid(self):
+        for value in ["", "-", "12", " 1"]:
+            with pytest.raises(ValueError):
+                cn.transcode(value, sys2, sys16)